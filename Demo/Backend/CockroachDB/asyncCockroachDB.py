@@ -0,0 +1,255 @@
+import asyncio
+import os
+import sys
+import threading
+import uuid
+from contextlib import asynccontextmanager
+from typing import Dict, Optional, Tuple
+
+from psycopg_pool import AsyncConnectionPool
+
+sys.path.append(os.path.abspath(os.path.join(os.getcwd(), "..")))
+from CockroachDB.backend import BulkWriteError, batches
+from CockroachDB.retry import shared_retry
+
+# Same knobs as the synchronous agent
+FETCH_SIZE = int(os.getenv("DB_FETCH_SIZE", "500"))
+BATCH_SIZE = int(os.getenv("DB_BATCH_SIZE", "500"))
+
+
+# One async pool per connection string and event loop: a psycopg pool is tied
+# to the loop it was opened on, so a new loop (e.g. a restarted server) gets its own
+_pools: Dict[str, Tuple[asyncio.AbstractEventLoop, AsyncConnectionPool]] = {}
+_pools_lock = threading.Lock()
+
+
+async def _close_entry(entry: Tuple[asyncio.AbstractEventLoop, AsyncConnectionPool]) -> None:
+    """Close a pool on the loop it was opened on"""
+    loop, pool = entry
+    if loop is asyncio.get_running_loop():
+        await pool.close()
+    elif loop.is_running():
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(pool.close(), loop))
+    # A pool whose loop has stopped has no workers left; its connections close when collected
+
+
+async def shared_async_pool(
+    dsn: str, min_size: Optional[int] = None, max_size: Optional[int] = None
+) -> AsyncConnectionPool:
+    loop = asyncio.get_running_loop()
+    stale = None
+    with _pools_lock:
+        entry = _pools.get(dsn)
+        if entry is None or entry[0] is not loop or entry[1].closed:
+            pool = AsyncConnectionPool(
+                dsn,
+                min_size=min_size if min_size is not None else int(os.getenv("DB_POOL_MIN", "1")),
+                max_size=max_size if max_size is not None else int(os.getenv("DB_POOL_MAX", "10")),
+                timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+                open=False,
+            )
+            _pools[dsn] = (loop, pool)
+            if entry is not None and not entry[1].closed:
+                stale = entry
+        else:
+            pool = entry[1]
+    if stale is not None:
+        await _close_entry(stale)
+    # Opening an already open pool is a no-op
+    await pool.open()
+    return pool
+
+
+async def close_async_pool(dsn: str) -> None:
+    with _pools_lock:
+        entry = _pools.pop(dsn, None)
+    if entry is not None:
+        await _close_entry(entry)
+
+
+class AsyncCockroachDBAgent:
+    """
+    CockroachDBAgent for async callers, on psycopg 3 and a shared AsyncConnectionPool.
+
+    Same methods, return values and errors as the synchronous agent, as
+    coroutines (iter_candidates is an async generator). Waiting on the database
+    suspends the calling task instead of blocking a thread, so many sessions in
+    async graph execution share one event loop. Writes use the same retry
+    protocol and the same per-URL retry stats as the synchronous agent.
+    """
+
+    def __init__(self, connection_string, min_size=None, max_size=None):
+        self.connection_string = connection_string
+        self.min_size = min_size
+        self.max_size = max_size
+        self.retry = shared_retry(connection_string)
+
+    async def pool(self) -> AsyncConnectionPool:
+        return await shared_async_pool(self.connection_string, self.min_size, self.max_size)
+
+    async def connect(self):
+        """Open the pool (connections are otherwise opened on first use)"""
+        try:
+            await self.pool()
+            print("Connected to CockroachDB successfully!")
+        except Exception as e:
+            print(f"Error: Unable to connect to the database: {e}")
+
+    @asynccontextmanager
+    async def borrow(self):
+        """Borrow a pooled connection for the duration of the block"""
+        pool = await self.pool()
+        async with pool.connection() as connection:
+            yield connection
+
+    @asynccontextmanager
+    async def transaction(self):
+        """Cursor on a pooled connection; commits on success, rolls back on error"""
+        async with self.borrow() as connection:
+            try:
+                async with connection.cursor() as cursor:
+                    yield cursor
+                await connection.commit()
+            except BaseException:
+                await connection.rollback()
+                raise
+
+    async def run_transaction(self, work, name="transaction"):
+        """Await work(cursor) in one transaction with CockroachDB's retry protocol; returns its result and raises on failure"""
+        async with self.borrow() as connection:
+            return await self.retry.arun(connection, work, name)
+
+    async def insert_candidate(self, first_name, last_name, description):
+        """Insert a new candidate into the database; returns the new id"""
+        async def work(cursor):
+            await cursor.execute(
+                """
+                INSERT INTO HRCandidates(description, first_name, last_name)
+                VALUES (%s, %s, %s)
+                RETURNING id
+                """,
+                (description, first_name, last_name)
+            )
+            return (await cursor.fetchone())[0]
+
+        candidate_id = await self.run_transaction(work, "insert_candidate")
+        print(f"Candidate inserted successfully!")
+        return candidate_id
+
+    async def insert_candidates(self, candidates, batch_size=None):
+        """Insert (first_name, last_name, description) tuples, batch_size rows per statement and transaction; returns the new ids"""
+        rows = [(description, first_name, last_name) for first_name, last_name, description in candidates]
+        ids = []
+        for batch in batches(rows, batch_size or BATCH_SIZE):
+            # One multi-row INSERT per batch, like execute_values in the sync agent
+            async def work(cursor, batch=batch):
+                await cursor.execute(
+                    "INSERT INTO HRCandidates(description, first_name, last_name) VALUES "
+                    + ", ".join(["(%s, %s, %s)"] * len(batch))
+                    + " RETURNING id",
+                    [value for row in batch for value in row],
+                )
+                return [row[0] for row in await cursor.fetchall()]
+
+            try:
+                ids.extend(await self.run_transaction(work, "insert_candidates"))
+            except Exception as e:
+                raise BulkWriteError(f"Inserted {len(ids)} of {len(rows)} candidates: {e}", ids) from e
+        print(f"{len(ids)} candidates inserted successfully!")
+        return ids
+
+    async def get_candidates(self):
+        """Fetch and return all candidates from the database"""
+        try:
+            return [row async for row in self.iter_candidates()]
+        except Exception as e:
+            print(f"Error fetching candidates: {e}")
+            return []
+
+    async def iter_candidates(self, fetch_size=None):
+        """Yield candidates ordered by id through a named server-side cursor, fetch_size rows per round trip"""
+        async with self.borrow() as connection:
+            try:
+                async with connection.cursor(name=f"hr_candidates_{uuid.uuid4().hex}") as cursor:
+                    cursor.itersize = fetch_size or FETCH_SIZE
+                    await cursor.execute("SELECT * FROM HRCandidates ORDER BY id")
+                    async for row in cursor:
+                        yield row
+                await connection.commit()
+            except BaseException:
+                # Also reached when the caller stops iterating early
+                await connection.rollback()
+                raise
+
+    async def get_candidates_page(self, after_id=None, limit=50):
+        """Return (rows, next_after_id) for up to limit candidates with id > after_id; next_after_id is None on the last page"""
+        async with self.transaction() as cursor:
+            if after_id is None:
+                await cursor.execute("SELECT * FROM HRCandidates ORDER BY id LIMIT %s", (limit,))
+            else:
+                await cursor.execute(
+                    "SELECT * FROM HRCandidates WHERE id > %s ORDER BY id LIMIT %s",
+                    (after_id, limit),
+                )
+            rows = await cursor.fetchall()
+            id_index = [column.name for column in cursor.description].index("id")
+        next_after_id = rows[-1][id_index] if len(rows) == limit else None
+        return rows, next_after_id
+
+    async def delete_candidate(self, candidate_id):
+        """Delete a candidate from the database by ID; returns how many rows were deleted (0 or 1)"""
+        async def work(cursor):
+            await cursor.execute(
+                """
+                DELETE FROM HRCandidates
+                WHERE id = %s
+                """,
+                (candidate_id,)
+            )
+            return cursor.rowcount
+
+        deleted = await self.run_transaction(work, "delete_candidate")
+        print(f"Candidate with ID {candidate_id} deleted successfully!")
+        return deleted
+
+    async def delete_candidates(self, candidate_ids, batch_size=None):
+        """Delete candidates by ID with DELETE ... WHERE id = ANY(%s); returns how many rows were deleted"""
+        candidate_ids = list(candidate_ids)
+        deleted = 0
+        for batch in batches(candidate_ids, batch_size or BATCH_SIZE):
+            async def work(cursor, batch=batch):
+                await cursor.execute(
+                    "DELETE FROM HRCandidates WHERE id = ANY(%s::INT8[])",
+                    ([str(candidate_id) for candidate_id in batch],),
+                )
+                return cursor.rowcount
+
+            try:
+                deleted += await self.run_transaction(work, "delete_candidates")
+            except Exception as e:
+                raise BulkWriteError(f"Deleted {deleted} candidates before failing: {e}", deleted) from e
+        print(f"{deleted} candidates deleted successfully!")
+        return deleted
+
+    async def print_candidates(self):
+        """Print the candidate data fetched from the database"""
+        count = 0
+        async for row in self.iter_candidates():
+            print("Canidate: ", count, "Information: ", row)
+            count += 1
+
+    async def stats(self):
+        """Pool size and request waits, plus retry counts and latency of the write transactions"""
+        pool = await self.pool()
+        return {"pool": pool.get_stats(), "transactions": self.retry.stats()}
+
+    async def close(self):
+        """Close the pool for this connection string"""
+        await close_async_pool(self.connection_string)
+        print("Connection closed.")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
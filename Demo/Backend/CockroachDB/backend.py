@@ -0,0 +1,164 @@
+"""
+Storage backends for the HRCandidates table.
+
+Every backend agent offers the same surface as CockroachDBAgent: connect,
+insert_candidate(s), get_candidates, iter_candidates, get_candidates_page,
+delete_candidate(s), run_transaction, print_candidates, stats, close and use as
+a context manager. Writes raise on failure (BulkWriteError for a bulk write
+that failed part way). open_agent() picks the backend from the URL scheme, so
+tools, the socket server and benchmarks run against a local SQLite file the
+same way they run against CockroachDB:
+
+    open_agent("postgresql://root@localhost:26257/defaultdb")  # CockroachDBAgent
+    open_agent("sqlite:///Data/hr_candidates.sqlite")         # SQLiteDBAgent
+
+open_async_agent() does the same for async callers: CockroachDB gets the
+psycopg 3 AsyncCockroachDBAgent, and backends without a native async agent
+(SQLite) are wrapped in AsyncAgent, which runs each call on a worker thread.
+"""
+import asyncio
+import threading
+from typing import Any, Callable, Dict
+
+
+def batches(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class BulkWriteError(Exception):
+    """A bulk write failed part way; earlier batches stay committed and `completed` holds their ids (insert) or row count (delete)"""
+
+    def __init__(self, message, completed):
+        super().__init__(message)
+        self.completed = completed
+
+
+# Agent classes are imported lazily, so SQLite needs no Postgres driver
+def _cockroach():
+    from CockroachDB.cockroachDB import CockroachDBAgent
+
+    return CockroachDBAgent
+
+
+def _sqlite():
+    from CockroachDB.sqliteDB import SQLiteDBAgent
+
+    return SQLiteDBAgent
+
+
+_backends: Dict[str, Callable[[], type]] = {
+    "postgresql": _cockroach,
+    "postgres": _cockroach,
+    "cockroachdb": _cockroach,
+    "sqlite": _sqlite,
+}
+_backends_lock = threading.Lock()
+
+
+def _async_cockroach():
+    from CockroachDB.asyncCockroachDB import AsyncCockroachDBAgent
+
+    return AsyncCockroachDBAgent
+
+
+_async_backends: Dict[str, Callable[[], type]] = {
+    "postgresql": _async_cockroach,
+    "postgres": _async_cockroach,
+    "cockroachdb": _async_cockroach,
+}
+
+
+def register_backend(
+    scheme: str, loader: Callable[[], type], async_loader: Callable[[], type] = None
+) -> None:
+    """Serve URLs starting with `scheme://` by the agent class loader() returns (and async_loader() for async callers)."""
+    with _backends_lock:
+        _backends[scheme] = loader
+        if async_loader is not None:
+            _async_backends[scheme] = async_loader
+
+
+def _scheme(url: str) -> str:
+    return url.split("://", 1)[0].split("+", 1)[0].lower() if "://" in url else ""
+
+
+def backend_for(url: str) -> type:
+    scheme = _scheme(url)
+    with _backends_lock:
+        loader = _backends.get(scheme)
+    if loader is None:
+        raise ValueError(f"No storage backend for {scheme or url!r}; known: {sorted(_backends)}")
+    return loader()
+
+
+def open_agent(url: str, **kwargs: Any):
+    """Agent for the database at url (DATABASE_URL in the tools and socket server)."""
+    return backend_for(url)(url, **kwargs)
+
+
+class AsyncAgent:
+    """
+    Async face for a synchronous agent: every call runs on a worker thread via
+    asyncio.to_thread, so the event loop is never blocked. Used for backends
+    whose calls are short and local (SQLite); iter_candidates walks keyset pages
+    so a thread is only held for one page at a time.
+    """
+
+    def __init__(self, agent):
+        self.agent = agent
+        self.connection_string = agent.connection_string
+
+    async def connect(self):
+        await asyncio.to_thread(self.agent.connect)
+
+    async def insert_candidate(self, first_name, last_name, description):
+        return await asyncio.to_thread(self.agent.insert_candidate, first_name, last_name, description)
+
+    async def insert_candidates(self, candidates, batch_size=None):
+        return await asyncio.to_thread(self.agent.insert_candidates, candidates, batch_size)
+
+    async def get_candidates(self):
+        return await asyncio.to_thread(self.agent.get_candidates)
+
+    async def iter_candidates(self, fetch_size=None):
+        after_id = None
+        while True:
+            rows, after_id = await self.get_candidates_page(after_id, fetch_size or 500)
+            for row in rows:
+                yield row
+            if after_id is None:
+                return
+
+    async def get_candidates_page(self, after_id=None, limit=50):
+        return await asyncio.to_thread(self.agent.get_candidates_page, after_id, limit)
+
+    async def delete_candidate(self, candidate_id):
+        return await asyncio.to_thread(self.agent.delete_candidate, candidate_id)
+
+    async def delete_candidates(self, candidate_ids, batch_size=None):
+        return await asyncio.to_thread(self.agent.delete_candidates, candidate_ids, batch_size)
+
+    async def print_candidates(self):
+        await asyncio.to_thread(self.agent.print_candidates)
+
+    async def stats(self):
+        return self.agent.stats()
+
+    async def close(self):
+        await asyncio.to_thread(self.agent.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+def open_async_agent(url: str, **kwargs: Any):
+    """Async agent for the database at url; nothing connects until the first call."""
+    with _backends_lock:
+        loader = _async_backends.get(_scheme(url))
+    if loader is not None:
+        return loader()(url, **kwargs)
+    return AsyncAgent(open_agent(url, **kwargs))
@@ -1,64 +1,188 @@
-import psycopg2
+import os
+import sys
+import uuid
+from contextlib import contextmanager
+
+from psycopg2.extras import execute_values
+
+sys.path.append(os.path.abspath(os.path.join(os.getcwd(), "..")))
+from CockroachDB.backend import BulkWriteError, batches
+from CockroachDB.pool import close_pool, shared_pool
+from CockroachDB.retry import shared_retry
+
+# Rows per round trip when streaming through a server-side cursor
+FETCH_SIZE = int(os.getenv("DB_FETCH_SIZE", "500"))
+# Rows per statement (and per transaction) for bulk inserts and deletes
+BATCH_SIZE = int(os.getenv("DB_BATCH_SIZE", "500"))
+
 
 class CockroachDBAgent:
-    def __init__(self, connection_string):
-        """Initialize with a connection string"""
+    def __init__(self, connection_string, min_size=None, max_size=None):
+        """Initialize with a connection string; connections come from a pool shared per string"""
         self.connection_string = connection_string
-        self.connection =  self.connect()
-        self.cursor = None
+        self.min_size = min_size
+        self.max_size = max_size
+        self.retry = shared_retry(connection_string)
+
+    # Looked up on every use, so a pool closed through another agent is replaced
+    @property
+    def pool(self):
+        return shared_pool(self.connection_string, self.min_size, self.max_size)
     
-    # Connects to the CockroachDB using the connection string
+    # Opens the pool's minimum number of connections up front
     def connect(self):
-        """Establish a connection using the connection string"""
+        """Warm up the connection pool (connections are otherwise opened on demand)"""
         try:
-            self.connection = psycopg2.connect(self.connection_string)
-            self.cursor = self.connection.cursor()
+            self.pool.open()
             print("Connected to CockroachDB successfully!")
         except Exception as e:
             print(f"Error: Unable to connect to the database: {e}")
+
+    @contextmanager
+    def borrow(self):
+        """Borrow a pooled connection for the duration of the block"""
+        with self.pool.connection() as connection:
+            yield connection
+
+    @contextmanager
+    def transaction(self):
+        """Cursor on a pooled connection; commits on success, rolls back on error"""
+        with self.borrow() as connection:
+            try:
+                with connection.cursor() as cursor:
+                    yield cursor
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
     
+    # Every write goes through here so serialization failures are retried, not lost
+    def run_transaction(self, work, name="transaction"):
+        """Run work(cursor) in one transaction with CockroachDB's retry protocol; returns its result and raises on failure"""
+        with self.borrow() as connection:
+            return self.retry.run(connection, work, name)
+
     # Inserts new canidates onto the database itself
     def insert_candidate(self,first_name, last_name, description):
-        """Insert a new candidate into the database"""
-        try:
-            self.cursor.execute(
+        """Insert a new candidate into the database; returns the new id"""
+        def work(cursor):
+            cursor.execute(
                 """
                 INSERT INTO HRCandidates(description, first_name, last_name)
                 VALUES (%s, %s, %s)
+                RETURNING id
                 """,
                 (description, first_name, last_name)
             )
-            self.connection.commit()
-            print(f"Candidate inserted successfully!")
-        except Exception as e:
-            print(f"Error inserting candidate: {e}")
+            return cursor.fetchone()[0]
+
+        candidate_id = self.run_transaction(work, "insert_candidate")
+        print(f"Candidate inserted successfully!")
+        return candidate_id
     
+    # Inserts many candidates with one multi-row INSERT per batch
+    def insert_candidates(self, candidates, batch_size=None):
+        """Insert (first_name, last_name, description) tuples, batch_size rows per statement and transaction; returns the new ids"""
+        rows = [(description, first_name, last_name) for first_name, last_name, description in candidates]
+        ids = []
+        for batch in batches(rows, batch_size or BATCH_SIZE):
+            def work(cursor, batch=batch):
+                return [
+                    row[0]
+                    for row in execute_values(
+                        cursor,
+                        "INSERT INTO HRCandidates(description, first_name, last_name) VALUES %s RETURNING id",
+                        batch,
+                        page_size=len(batch),
+                        fetch=True,
+                    )
+                ]
+
+            try:
+                ids.extend(self.run_transaction(work, "insert_candidates"))
+            except Exception as e:
+                raise BulkWriteError(f"Inserted {len(ids)} of {len(rows)} candidates: {e}", ids) from e
+        print(f"{len(ids)} candidates inserted successfully!")
+        return ids
+
     # Retrives the new canidate information from the database
     def get_candidates(self):
         """Fetch and return all candidates from the database"""
         try:
-            self.cursor.execute("SELECT * FROM HRCandidates")
-            rows = self.cursor.fetchall()
-            return rows
+            return list(self.iter_candidates())
         except Exception as e:
             print(f"Error fetching candidates: {e}")
             return []
 
+    # Streams the candidates without loading the whole table at once
+    def iter_candidates(self, fetch_size=None):
+        """Yield candidates ordered by id through a named server-side cursor, fetch_size rows per round trip"""
+        with self.borrow() as connection:
+            try:
+                # A named cursor keeps the result set on the server
+                with connection.cursor(name=f"hr_candidates_{uuid.uuid4().hex}") as cursor:
+                    cursor.itersize = fetch_size or FETCH_SIZE
+                    cursor.execute("SELECT * FROM HRCandidates ORDER BY id")
+                    for row in cursor:
+                        yield row
+                connection.commit()
+            except BaseException:
+                # Also reached when the caller stops iterating early
+                connection.rollback()
+                raise
+
+    # Keyset pagination: each page starts after the last id of the previous one
+    def get_candidates_page(self, after_id=None, limit=50):
+        """Return (rows, next_after_id) for up to limit candidates with id > after_id; next_after_id is None on the last page"""
+        with self.transaction() as cursor:
+            if after_id is None:
+                cursor.execute("SELECT * FROM HRCandidates ORDER BY id LIMIT %s", (limit,))
+            else:
+                cursor.execute(
+                    "SELECT * FROM HRCandidates WHERE id > %s ORDER BY id LIMIT %s",
+                    (after_id, limit),
+                )
+            rows = cursor.fetchall()
+            id_index = [column[0] for column in cursor.description].index("id")
+        next_after_id = rows[-1][id_index] if len(rows) == limit else None
+        return rows, next_after_id
+
     # Deletes the canidate information from the database 
     def delete_candidate(self, candidate_id):
-        """Delete a candidate from the database by ID"""
-        try:
-            self.cursor.execute(
+        """Delete a candidate from the database by ID; returns how many rows were deleted (0 or 1)"""
+        def work(cursor):
+            cursor.execute(
                 """
                 DELETE FROM HRCandidates
                 WHERE id = %s
                 """,
                 (candidate_id,)
             )
-            self.connection.commit()
-            print(f"Candidate with ID {candidate_id} deleted successfully!")
-        except Exception as e:
-            print(f"Error deleting candidate: {e}")
+            return cursor.rowcount
+
+        deleted = self.run_transaction(work, "delete_candidate")
+        print(f"Candidate with ID {candidate_id} deleted successfully!")
+        return deleted
+
+    # Deletes many candidates with one statement per batch of ids
+    def delete_candidates(self, candidate_ids, batch_size=None):
+        """Delete candidates by ID with DELETE ... WHERE id = ANY(%s); returns how many rows were deleted"""
+        candidate_ids = list(candidate_ids)
+        deleted = 0
+        for batch in batches(candidate_ids, batch_size or BATCH_SIZE):
+            def work(cursor, batch=batch):
+                cursor.execute(
+                    "DELETE FROM HRCandidates WHERE id = ANY(%s::INT8[])",
+                    (batch,),
+                )
+                return cursor.rowcount
+
+            try:
+                deleted += self.run_transaction(work, "delete_candidates")
+            except Exception as e:
+                raise BulkWriteError(f"Deleted {deleted} candidates before failing: {e}", deleted) from e
+        print(f"{deleted} candidates deleted successfully!")
+        return deleted
             
     def print_candidates(self):
         """Print the candidate data fetched from the database"""
@@ -66,13 +190,20 @@ class CockroachDBAgent:
         for count, row in enumerate(rows):
             print("Canidate: ", count, "Information: ", row)
     
+    def stats(self):
+        """Pool size and checkout waits, plus retry counts and latency of the write transactions"""
+        return {"pool": self.pool.stats(), "transactions": self.retry.stats()}
+
     def close(self):
-        """Close the connection to the database"""
-        if self.cursor:
-            self.cursor.close()
-        if self.connection:
-            self.connection.close()
+        """Close the pooled connections for this connection string; agents still using it open a new pool on their next call"""
+        close_pool(self.connection_string)
         print("Connection closed.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
         
     def as_retriver(self): 
         return self
@@ -0,0 +1,224 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import psycopg2
+from psycopg2 import extensions
+
+
+class PoolTimeout(Exception):
+    """No connection became free within the checkout timeout."""
+
+
+class ConnectionPool:
+    """
+    Thread-safe psycopg2 connection pool.
+
+    Keeps between `min_size` and `max_size` open connections. A checkout reuses
+    an idle connection when there is one, opens a new one while under
+    `max_size`, and otherwise waits up to `timeout` seconds for a return.
+    Connections are health-checked on checkout: closed ones are replaced, and
+    ones idle for longer than `check_interval` are pinged with SELECT 1 first.
+    A connection returned mid-transaction is rolled back. Handshakes, checkouts
+    and time spent waiting are counted for stats().
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        check_interval: float = 30.0,
+        connect: Callable[[str], Any] = psycopg2.connect,
+    ):
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max(max_size, min_size, 1)
+        self.timeout = timeout
+        self.check_interval = check_interval
+        self._connect = connect
+        self._idle: List[tuple] = []  # (connection, returned_at), most recent last
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        self.handshakes = 0
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.health_failures = 0
+
+    def _open(self):
+        connection = self._connect(self.dsn)
+        with self._cond:
+            self.handshakes += 1
+        return connection
+
+    def open(self) -> None:
+        """Open connections up to min_size (otherwise they are opened on demand)."""
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                connection = self._open()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                raise
+            with self._cond:
+                self._idle.append((connection, time.monotonic()))
+                self._cond.notify()
+
+    def _healthy(self, connection, returned_at: float) -> bool:
+        if connection.closed:
+            return False
+        if time.monotonic() - returned_at < self.check_interval:
+            return True
+        try:
+            with connection.cursor() as cur:
+                cur.execute("SELECT 1")
+            connection.rollback()
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, connection) -> None:
+        try:
+            connection.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    def getconn(self):
+        start = time.monotonic()
+        deadline = start + self.timeout
+        waited = False
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise PoolTimeout("Connection pool is closed")
+                if self._idle:
+                    connection, returned_at = self._idle.pop()
+                elif self._size < self.max_size:
+                    self._size += 1
+                    connection = returned_at = None
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolTimeout(
+                            f"No connection available after {self.timeout}s "
+                            f"({self.max_size} in use)"
+                        )
+                    waited = True
+                    self._cond.wait(remaining)
+                    continue
+
+            if connection is None:
+                try:
+                    connection = self._open()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+            elif not self._healthy(connection, returned_at):
+                with self._cond:
+                    self.health_failures += 1
+                self._discard(connection)
+                continue
+
+            elapsed = time.monotonic() - start
+            with self._cond:
+                self.checkouts += 1
+                if waited:
+                    self.waits += 1
+                    self.wait_seconds += elapsed
+                    self.max_wait_seconds = max(self.max_wait_seconds, elapsed)
+            return connection
+
+    def putconn(self, connection) -> None:
+        if self._closed or connection.closed:
+            self._discard(connection)
+            return
+        try:
+            if connection.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+                connection.rollback()
+        except Exception:
+            self._discard(connection)
+            return
+        with self._cond:
+            self._idle.append((connection, time.monotonic()))
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Borrow a connection for the duration of the block."""
+        connection = self.getconn()
+        try:
+            yield connection
+        finally:
+            self.putconn(connection)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for connection, _ in idle:
+            self._discard(connection)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "handshakes": self.handshakes,
+                "checkouts": self.checkouts,
+                "waits": self.waits,
+                "total_wait_seconds": round(self.wait_seconds, 4),
+                "max_wait_seconds": round(self.max_wait_seconds, 4),
+                "health_check_failures": self.health_failures,
+            }
+
+
+# One pool per connection string, shared by every agent/tool in the process
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def shared_pool(
+    dsn: str, min_size: Optional[int] = None, max_size: Optional[int] = None
+) -> ConnectionPool:
+    with _pools_lock:
+        pool = _pools.get(dsn)
+        if pool is None or pool.closed:
+            pool = _pools[dsn] = ConnectionPool(
+                dsn,
+                min_size=min_size if min_size is not None else int(os.getenv("DB_POOL_MIN", "1")),
+                max_size=max_size if max_size is not None else int(os.getenv("DB_POOL_MAX", "10")),
+                timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+                check_interval=float(os.getenv("DB_POOL_CHECK_SECONDS", "30")),
+            )
+        return pool
+
+
+def close_pool(dsn: str) -> None:
+    with _pools_lock:
+        pool = _pools.pop(dsn, None)
+    if pool is not None:
+        pool.close()
@@ -0,0 +1,199 @@
+import asyncio
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+# SQLSTATE CockroachDB (and Postgres at SERIALIZABLE) uses for a transaction
+# that lost a conflict and is safe to run again
+RETRY_SQLSTATE = "40001"
+SAVEPOINT = "cockroach_restart"
+
+
+class RetriesExhausted(Exception):
+    """A transaction kept hitting serialization failures past max_retries."""
+
+
+def is_retryable(error: BaseException) -> bool:
+    # psycopg2 errors carry the SQLSTATE as pgcode, psycopg 3 errors as sqlstate
+    code = getattr(error, "pgcode", None) or getattr(error, "sqlstate", None)
+    return code == RETRY_SQLSTATE
+
+
+class TransactionRetry:
+    """
+    CockroachDB client-side transaction retry protocol.
+
+    The work runs inside SAVEPOINT cockroach_restart. On a 40001 serialization
+    failure the transaction is rolled back to the savepoint (or, if that is no
+    longer possible, rolled back and restarted), the caller sleeps for an
+    exponentially growing delay with full jitter, and the work runs again, up
+    to `max_retries` times. Any other error rolls back and propagates; nothing
+    is dropped silently. Each call records its name, attempts and latency.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 8,
+        base_delay: float = 0.01,
+        max_delay: float = 1.0,
+        history: int = 1000,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+        self._records = deque(maxlen=history)
+        self._lock = threading.Lock()
+
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+        self.exhausted = 0
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def _restart(self, connection, cursor) -> None:
+        try:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {SAVEPOINT}")
+        except Exception:
+            # The failure hit COMMIT (or the savepoint is gone): start over
+            connection.rollback()
+            cursor.execute(f"SAVEPOINT {SAVEPOINT}")
+
+    def run(self, connection, work: Callable[[Any], Any], name: str = "transaction") -> Any:
+        """Run work(cursor) in one transaction on connection, retrying serialization failures."""
+        start = time.perf_counter()
+        attempts = 0
+        outcome = "ok"
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(f"SAVEPOINT {SAVEPOINT}")
+                while True:
+                    attempts += 1
+                    try:
+                        result = work(cursor)
+                        cursor.execute(f"RELEASE SAVEPOINT {SAVEPOINT}")
+                        connection.commit()
+                        return result
+                    except Exception as e:
+                        if not is_retryable(e):
+                            raise
+                        if attempts > self.max_retries:
+                            outcome = "exhausted"
+                            raise RetriesExhausted(
+                                f"{name} gave up after {attempts} attempts: {e}"
+                            ) from e
+                        self._restart(connection, cursor)
+                        self._sleep(self.backoff(attempts))
+        except BaseException:
+            if outcome == "ok":
+                outcome = "error"
+            try:
+                connection.rollback()
+            except Exception:
+                pass
+            raise
+        finally:
+            self.record(name, attempts, time.perf_counter() - start, outcome)
+
+    async def _arestart(self, connection, cursor) -> None:
+        try:
+            await cursor.execute(f"ROLLBACK TO SAVEPOINT {SAVEPOINT}")
+        except Exception:
+            await connection.rollback()
+            await cursor.execute(f"SAVEPOINT {SAVEPOINT}")
+
+    async def arun(self, connection, work: Callable[[Any], Any], name: str = "transaction") -> Any:
+        """run() for an async connection (psycopg 3): awaits work(cursor) and sleeps without blocking the loop."""
+        start = time.perf_counter()
+        attempts = 0
+        outcome = "ok"
+        try:
+            async with connection.cursor() as cursor:
+                await cursor.execute(f"SAVEPOINT {SAVEPOINT}")
+                while True:
+                    attempts += 1
+                    try:
+                        result = await work(cursor)
+                        await cursor.execute(f"RELEASE SAVEPOINT {SAVEPOINT}")
+                        await connection.commit()
+                        return result
+                    except Exception as e:
+                        if not is_retryable(e):
+                            raise
+                        if attempts > self.max_retries:
+                            outcome = "exhausted"
+                            raise RetriesExhausted(
+                                f"{name} gave up after {attempts} attempts: {e}"
+                            ) from e
+                        await self._arestart(connection, cursor)
+                        await asyncio.sleep(self.backoff(attempts))
+        except BaseException:
+            if outcome == "ok":
+                outcome = "error"
+            try:
+                await connection.rollback()
+            except Exception:
+                pass
+            raise
+        finally:
+            self.record(name, attempts, time.perf_counter() - start, outcome)
+
+    def record(self, name: str, attempts: int, seconds: float, outcome: str) -> None:
+        with self._lock:
+            self._records.append(
+                {
+                    "name": name,
+                    "attempts": attempts,
+                    "retries": max(attempts - 1, 0),
+                    "seconds": round(seconds, 6),
+                    "outcome": outcome,
+                }
+            )
+            self.calls += 1
+            self.retries += max(attempts - 1, 0)
+            if outcome != "ok":
+                self.failures += 1
+            if outcome == "exhausted":
+                self.exhausted += 1
+
+    def stats(self, recent: int = 20) -> Dict[str, Any]:
+        with self._lock:
+            records = list(self._records)
+            totals = {
+                "calls": self.calls,
+                "retries": self.retries,
+                "failures": self.failures,
+                "exhausted": self.exhausted,
+            }
+        seconds = sorted(r["seconds"] for r in records)
+        return {
+            **totals,
+            "max_retries": self.max_retries,
+            "avg_seconds": round(sum(seconds) / len(seconds), 6) if seconds else 0.0,
+            "p95_seconds": seconds[int(0.95 * (len(seconds) - 1))] if seconds else 0.0,
+            "max_attempts": max((r["attempts"] for r in records), default=0),
+            "recent": records[-recent:],
+        }
+
+
+# One retry policy (and its stats) per connection string, like the pools
+_policies: Dict[str, TransactionRetry] = {}
+_policies_lock = threading.Lock()
+
+
+def shared_retry(dsn: str, max_retries: Optional[int] = None) -> TransactionRetry:
+    with _policies_lock:
+        policy = _policies.get(dsn)
+        if policy is None:
+            policy = _policies[dsn] = TransactionRetry(
+                max_retries=max_retries if max_retries is not None else int(os.getenv("DB_RETRY_MAX", "8")),
+                base_delay=float(os.getenv("DB_RETRY_BASE_SECONDS", "0.01")),
+                max_delay=float(os.getenv("DB_RETRY_MAX_SECONDS", "1.0")),
+            )
+        return policy
@@ -0,0 +1,254 @@
+import itertools
+import os
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+sys.path.append(os.path.abspath(os.path.join(os.getcwd(), "..")))
+from CockroachDB.backend import BulkWriteError, batches
+from CockroachDB.retry import shared_retry
+
+# Rows per fetchmany() when streaming
+FETCH_SIZE = int(os.getenv("DB_FETCH_SIZE", "500"))
+# Rows per transaction for bulk inserts and deletes
+BATCH_SIZE = int(os.getenv("DB_BATCH_SIZE", "500"))
+
+# Same columns as the CockroachDB table; AUTOINCREMENT keeps ids increasing
+# and never reuses them, like unique_rowid()
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS HRCandidates (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    description TEXT,
+    first_name TEXT,
+    last_name TEXT
+);
+"""
+
+_memory_ids = itertools.count()
+
+
+def sqlite_path(url):
+    """Database path for a SQLAlchemy-style URL: sqlite:///relative.db, sqlite:////absolute.db or sqlite:// (in memory)"""
+    path = url.split("://", 1)[1] if "://" in url else url
+    path = path[1:] if path.startswith("/") else path
+    return path or ":memory:"
+
+
+class SQLiteDBAgent:
+    """
+    Local stand-in for CockroachDBAgent on a SQLite file, with the same methods,
+    return values and errors for the HRCandidates table. Each thread gets its own
+    connection; writes take the write lock up front (BEGIN IMMEDIATE) and wait on
+    the busy timeout, so concurrent writers queue instead of failing. Transactions
+    are timed into the same stats as the CockroachDB agent.
+    """
+
+    def __init__(self, connection_string, min_size=None, max_size=None):
+        self.connection_string = connection_string
+        self.path = sqlite_path(connection_string)
+        self.uri = False
+        if self.path == ":memory:":
+            # A named shared-cache database lives as long as one connection to it does
+            self.path = f"file:hrcandidates-{os.getpid()}-{next(_memory_ids)}?mode=memory&cache=shared"
+            self.uri = True
+        elif os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.retry = shared_retry(connection_string)
+        self._local = threading.local()
+        self._connections = 0
+        self._connections_lock = threading.Lock()
+        self._keeper = self._conn()
+        self._keeper.executescript(SCHEMA)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, uri=self.uri, check_same_thread=False)
+            if not self.uri:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections += 1
+        return conn
+
+    # Connections are opened per thread on demand
+    def connect(self):
+        """Check that the database file is usable"""
+        try:
+            self._conn().execute("SELECT 1")
+            print("Connected to SQLite successfully!")
+        except Exception as e:
+            print(f"Error: Unable to connect to the database: {e}")
+
+    @contextmanager
+    def borrow(self):
+        """This thread's connection for the duration of the block"""
+        yield self._conn()
+
+    @contextmanager
+    def transaction(self):
+        """Cursor in a transaction; commits on success, rolls back on error"""
+        conn = self._conn()
+        conn.execute("BEGIN")
+        cursor = conn.cursor()
+        try:
+            yield cursor
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            cursor.close()
+        conn.execute("COMMIT")
+
+    def run_transaction(self, work, name="transaction"):
+        """Run work(cursor) in one write transaction; returns its result and raises on failure"""
+        conn = self._conn()
+        start = time.perf_counter()
+        outcome = "ok"
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.cursor()
+            try:
+                result = work(cursor)
+                conn.execute("COMMIT")
+                return result
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            finally:
+                cursor.close()
+        except BaseException:
+            outcome = "error"
+            raise
+        finally:
+            self.retry.record(name, 1, time.perf_counter() - start, outcome)
+
+    def insert_candidate(self, first_name, last_name, description):
+        """Insert a new candidate into the database; returns the new id"""
+        def work(cursor):
+            cursor.execute(
+                "INSERT INTO HRCandidates(description, first_name, last_name) VALUES (?, ?, ?)",
+                (description, first_name, last_name),
+            )
+            return cursor.lastrowid
+
+        candidate_id = self.run_transaction(work, "insert_candidate")
+        print(f"Candidate inserted successfully!")
+        return candidate_id
+
+    def insert_candidates(self, candidates, batch_size=None):
+        """Insert (first_name, last_name, description) tuples, batch_size rows per transaction; returns the new ids"""
+        rows = [(description, first_name, last_name) for first_name, last_name, description in candidates]
+        ids = []
+        for batch in batches(rows, batch_size or BATCH_SIZE):
+            # Per-row statements cost no round trips in-process, and give back each id
+            def work(cursor, batch=batch):
+                inserted = []
+                for row in batch:
+                    cursor.execute(
+                        "INSERT INTO HRCandidates(description, first_name, last_name) VALUES (?, ?, ?)",
+                        row,
+                    )
+                    inserted.append(cursor.lastrowid)
+                return inserted
+
+            try:
+                ids.extend(self.run_transaction(work, "insert_candidates"))
+            except Exception as e:
+                raise BulkWriteError(f"Inserted {len(ids)} of {len(rows)} candidates: {e}", ids) from e
+        print(f"{len(ids)} candidates inserted successfully!")
+        return ids
+
+    def get_candidates(self):
+        """Fetch and return all candidates from the database"""
+        try:
+            return list(self.iter_candidates())
+        except Exception as e:
+            print(f"Error fetching candidates: {e}")
+            return []
+
+    def iter_candidates(self, fetch_size=None):
+        """Yield candidates ordered by id, fetch_size rows at a time"""
+        cursor = self._conn().cursor()
+        try:
+            cursor.execute("SELECT * FROM HRCandidates ORDER BY id")
+            while True:
+                rows = cursor.fetchmany(fetch_size or FETCH_SIZE)
+                if not rows:
+                    return
+                yield from rows
+        finally:
+            cursor.close()
+
+    def get_candidates_page(self, after_id=None, limit=50):
+        """Return (rows, next_after_id) for up to limit candidates with id > after_id; next_after_id is None on the last page"""
+        with self.transaction() as cursor:
+            if after_id is None:
+                cursor.execute("SELECT * FROM HRCandidates ORDER BY id LIMIT ?", (limit,))
+            else:
+                cursor.execute(
+                    "SELECT * FROM HRCandidates WHERE id > ? ORDER BY id LIMIT ?",
+                    (int(after_id), limit),
+                )
+            rows = cursor.fetchall()
+            id_index = [column[0] for column in cursor.description].index("id")
+        next_after_id = rows[-1][id_index] if len(rows) == limit else None
+        return rows, next_after_id
+
+    def delete_candidate(self, candidate_id):
+        """Delete a candidate from the database by ID; returns how many rows were deleted (0 or 1)"""
+        def work(cursor):
+            cursor.execute("DELETE FROM HRCandidates WHERE id = ?", (int(candidate_id),))
+            return cursor.rowcount
+
+        deleted = self.run_transaction(work, "delete_candidate")
+        print(f"Candidate with ID {candidate_id} deleted successfully!")
+        return deleted
+
+    def delete_candidates(self, candidate_ids, batch_size=None):
+        """Delete candidates by ID, batch_size per transaction; returns how many rows were deleted"""
+        candidate_ids = [(int(candidate_id),) for candidate_id in candidate_ids]
+        deleted = 0
+        for batch in batches(candidate_ids, batch_size or BATCH_SIZE):
+            def work(cursor, batch=batch):
+                cursor.executemany("DELETE FROM HRCandidates WHERE id = ?", batch)
+                return cursor.rowcount
+
+            try:
+                deleted += self.run_transaction(work, "delete_candidates")
+            except Exception as e:
+                raise BulkWriteError(f"Deleted {deleted} candidates before failing: {e}", deleted) from e
+        print(f"{deleted} candidates deleted successfully!")
+        return deleted
+
+    def print_candidates(self):
+        """Print the candidate data fetched from the database"""
+        rows = self.get_candidates()
+        for count, row in enumerate(rows):
+            print("Canidate: ", count, "Information: ", row)
+
+    def stats(self):
+        """Open connections, plus latency of the write transactions"""
+        with self._connections_lock:
+            connections = self._connections
+        return {"pool": {"connections": connections}, "transactions": self.retry.stats()}
+
+    def close(self):
+        """Close this thread's connection (an in-memory database goes with its last one)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+        print("Connection closed.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def as_retriver(self):
+        return self
@@ -1,36 +1,40 @@
-import time
 from langchain_core.messages import SystemMessage
 from langchain_core.runnables import RunnableConfig
-from langchain_ollama import OllamaEmbeddings
-from langchain_ollama import ChatOllama
-from langchain_core.messages import HumanMessage
 import sys
 import os
-from langchain_mistralai import ChatMistralAI
-import time
 import dotenv
 
 dotenv.load_dotenv()
 # Having a system path so that the files are all readable
 sys.path.append(os.path.abspath(os.path.join(os.getcwd(), "..")))
-from tools.utility import tools
+from utils.registry import registry
 from utils.utils import AgentState
+from utils.rate_limiter import (
+    estimate_tokens,
+    is_rate_limited,
+    mistral_rate_limiter,
+    retry_after,
+)
+
+MAX_RATE_LIMIT_RETRIES = 3
 
 
 class Agent:
-    def __init__(self):
-        self.mistral_model = ChatMistralAI(
-            model="mistral-large-latest",
-            temperature=0,
-            api_key=os.getenv("MISTRAl_API_KEY"),
-        )
+    def __init__(self, model=None):
+        # The chat client, tools and bound model are shared process-wide through the
+        # registry. Any chat model with bind_tools can still be passed in, e.g. a
+        # stub for benchmarks; it is bound once here to the shared tools.
+        self.tools = registry.get("tools").toolkit()
+        if model is None:
+            self.mistral_model = registry.get("chat_model")
+            self.model_with_tool = registry.get("bound_model")
+        else:
+            self.mistral_model = model
+            self.model_with_tool = model.bind_tools(self.tools)
 
         # embeddings = OllamaEmbeddings(model="nomic-embed-text")
 
-        Tool = tools()
-        self.tools = Tool.toolkit()
-
-        self.model_with_tool = self.mistral_model.bind_tools(self.tools)
+        self.rate_limiter = mistral_rate_limiter
 
     def system_prompt(self) -> SystemMessage:
         """The system prompt for the Bitcoin recruiting agent with candidate tools."""
@@ -50,7 +54,7 @@ class Agent:
             INTERNAL PROCESS (DO NOT SHOW THIS TO USER):
             Follow this process internally but DO NOT output any intermediate steps:
             1. **Brainstorming Phase** - Generate candidate ASIC models from database
-            2. **Evaluation Phase** - Compute cost-per-TH/s and joules-per-TH metrics  
+            2. **Evaluation Phase** - Take cost-per-TH/s and joules-per-TH metrics from rank_asics
             3. **Debate & Prune Phase** - Compare ROI, energy cost, and reliability
             4. **Synthesis Phase** - Rank and select top 3 models
 
@@ -69,7 +73,10 @@ class Agent:
             {"error": "Cannot assist with unrelated questions; only ASIC model recommendation support"}
 
             ### EXECUTION RULES:
-            - Use the provided tools for retrieving ASIC specifications, pricing, and power metrics.
+            - Call the rank_asics tool with the budget, target hashrate and runtime (in days) from the input JSON; it returns the top models with cost_per_TH, joules_per_TH and estimated profit already computed.
+            - If no single listing reaches the target hashrate, call the fulfill_hashrate tool to get the cheapest mix of listings within the budget.
+            - To compare hardware, call summarize_models, which returns one row per ASIC model instead of every listing.
+            - Use the retrieval tools only when you need specifications that rank_asics does not return.
             - Perform all cost and efficiency calculations programmatically via tools; do not hardcode any values.
             - Do not introduce any external or unverified data; rely only on input JSON and tool outputs.
             - DO NOT SHOW ANY INTERMEDIATE STEPS, PROCESS, OR EXPLANATIONS.
@@ -126,15 +133,44 @@ class Agent:
         )
 
     def run_agent(self, state: AgentState, config: RunnableConfig) -> dict:
-        time.sleep(3)
-        model = self.mistral_model.bind_tools([tools])
-        try:
-            print("running")
-            response = self.model_with_tool.invoke(
-                [self.system_prompt()] + state["messages"], config
-            )
-        except Exception as e:
-            print(e)
-            return {"error": str(e)}
-
+        messages = [self.system_prompt()] + state["messages"]
+        estimated = estimate_tokens(messages)
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            # Waits only when the shared request/token budget is exhausted
+            self.rate_limiter.acquire(estimated)
+            try:
+                response = self.model_with_tool.invoke(messages, config)
+                break
+            except Exception as e:
+                if is_rate_limited(e) and attempt < MAX_RATE_LIMIT_RETRIES:
+                    self.rate_limiter.backoff(retry_after(e))
+                    continue
+                print(e)
+                return {"error": str(e)}
+
+        return self._finish(response, estimated)
+
+    async def arun_agent(self, state: AgentState, config: RunnableConfig) -> dict:
+        """Async twin of run_agent, used when the graph is driven with ainvoke/astream."""
+        messages = [self.system_prompt()] + state["messages"]
+        estimated = estimate_tokens(messages)
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            await self.rate_limiter.aacquire(estimated)
+            try:
+                response = await self.model_with_tool.ainvoke(messages, config)
+                break
+            except Exception as e:
+                if is_rate_limited(e) and attempt < MAX_RATE_LIMIT_RETRIES:
+                    self.rate_limiter.backoff(retry_after(e))
+                    continue
+                print(e)
+                return {"error": str(e)}
+
+        return self._finish(response, estimated)
+
+    def _finish(self, response, estimated: int) -> dict:
+        self.rate_limiter.success()
+        usage = getattr(response, "usage_metadata", None)
+        if usage:
+            self.rate_limiter.record_usage(estimated, usage.get("total_tokens", estimated))
         return {"messages": [response]}
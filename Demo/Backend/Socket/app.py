@@ -1,54 +1,90 @@
-from flask import Flask, jsonify
+from flask import Flask, Response
 from flask_socketio import SocketIO, emit
 from flask_cors import CORS
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine
 import threading
 import time
-import datetime
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.getcwd(), "..")))
+from CockroachDB.backend import open_agent
+from Socket.changes import PollingFeed
+from Socket.snapshot import SnapshotJSON
 
 app = Flask(__name__)
 CORS(app, origins="http://localhost:3000", supports_credentials=True)
 
-socketio = SocketIO(app, cors_allowed_origins="http://localhost:3000")
+# SnapshotJSON writes the cached snapshot payload into packets without re-encoding it
+socketio = SocketIO(app, cors_allowed_origins="http://localhost:3000", json=SnapshotJSON)
 
-DATABASE_URL = ""
+# A sqlite:/// URL runs the feed against the local stand-in database
+DATABASE_URL = os.getenv("DATABASE_URL", "")
+if DATABASE_URL.startswith("sqlite:"):
+    # Creates the HRCandidates table if the file is new
+    open_agent(DATABASE_URL)
 engine = create_engine(DATABASE_URL)
 
+feed = PollingFeed(
+    engine,
+    version_column=os.getenv("FEED_VERSION_COLUMN") or None,
+    limit=int(os.getenv("FEED_ROW_LIMIT", "10")),
+)
+POLL_SECONDS = float(os.getenv("FEED_POLL_SECONDS", "5"))
+
+# The feed only polls while at least one client is connected
+clients = 0
+clients_lock = threading.Lock()
+clients_present = threading.Event()
+feed_thread = None
+
 @app.route('/data', methods=['GET'])
 def get_data():
-    with engine.connect() as conn:
-        result = conn.execute(text("SELECT * FROM HRCandidates LIMIT 10"))
-        rows = [dict(row._mapping) for row in result]
-        # Convert datetime objects to strings
-        for row in rows:
-            for key, value in row.items():
-                if isinstance(value, datetime.datetime):
-                    row[key] = value.isoformat()  # Convert datetime to ISO 8601 string
-    return jsonify(rows)
+    # At most one query per tick however many clients poll; the body is the
+    # same pre-serialized bytes the socket clients receive
+    tick()
+    return Response(feed.payload().body, mimetype="application/json")
 
 @socketio.on('connect')
 def handle_connect():
+    global clients, feed_thread
     print("Client connected")
-    emit_data()
-
-def emit_data():
-    with engine.connect() as conn:
-        result = conn.execute(text("SELECT * FROM HRCandidates LIMIT 10"))
-        rows = [dict(row._mapping) for row in result]
-        # Convert datetime objects to strings
-        for row in rows:
-            for key, value in row.items():
-                if isinstance(value, datetime.datetime):
-                    row[key] = value.isoformat()  # Convert datetime to ISO 8601 string
-    socketio.emit('data', rows)
+    with clients_lock:
+        clients += 1
+        if not clients_present.is_set():
+            # Nobody was listening, so the feed is stale; catch up before the
+            # snapshot instead of broadcasting everything as changes
+            feed.poll()
+            clients_present.set()
+        if feed_thread is None:
+            feed_thread = socketio.start_background_task(background_thread)
+    # The new client gets the current rows once, then only changes
+    emit('data', feed.payload())
+
+@socketio.on('disconnect')
+def handle_disconnect(*args):
+    global clients
+    print("Client disconnected")
+    with clients_lock:
+        clients = max(0, clients - 1)
+        if clients == 0:
+            clients_present.clear()
+
+def tick():
+    """Refresh the shared snapshot if it is older than one tick and push what changed."""
+    changes = feed.refresh(POLL_SECONDS)
+    if changes and clients_present.is_set():
+        socketio.emit('changes', {**changes.as_event(), "version": feed.version})
 
 def background_thread():
     while True:
-        emit_data()
-        time.sleep(5) 
-
-# Start background thread
-threading.Thread(target=background_thread, daemon=True).start()
+        # Blocks without touching the database while no client is connected
+        clients_present.wait()
+        try:
+            tick()
+        except Exception as e:
+            print(f"Error polling HRCandidates: {e}")
+        time.sleep(POLL_SECONDS)
 
 if __name__ == '__main__':
     socketio.run(app, port=5002, debug=True)
@@ -0,0 +1,165 @@
+import datetime
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from sqlalchemy import bindparam, text
+
+from Socket.snapshot import Serialized
+
+# Hidden columns that change on every write, tried in order when no version
+# column is configured: CockroachDB's MVCC timestamp, then Postgres' xmin
+SYSTEM_VERSION_COLUMNS = ("crdb_internal_mvcc_timestamp", "xmin")
+
+
+def serialize_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-ready copy of a row (datetimes as ISO 8601 strings)."""
+    return {
+        key: value.isoformat() if isinstance(value, (datetime.datetime, datetime.date)) else value
+        for key, value in row.items()
+    }
+
+
+def row_digest(row: Dict[str, Any]) -> str:
+    """Stand-in version for tables without a version column."""
+    payload = json.dumps(row, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class RowChanges(NamedTuple):
+    inserted: List[Dict[str, Any]]
+    updated: List[Dict[str, Any]]
+    deleted: List[Any]
+
+    def __bool__(self) -> bool:
+        return bool(self.inserted or self.updated or self.deleted)
+
+    def as_event(self) -> Dict[str, Any]:
+        return {"inserted": self.inserted, "updated": self.updated, "deleted": self.deleted}
+
+
+class PollingFeed:
+    """
+    Turns a table (or its first `limit` rows by key) into insert/update/delete events.
+
+    Each poll reads only the key and version of every row in the window, compares
+    them with the previous poll and fetches full rows just for the keys that are
+    new or whose version moved. Keys that disappeared are reported as deletes.
+    Without a version column the full window is read and rows are compared by
+    digest, which still only emits what changed.
+    """
+
+    def __init__(
+        self,
+        engine,
+        table: str = "HRCandidates",
+        key: str = "id",
+        version_column: Optional[str] = None,
+        limit: Optional[int] = 10,
+    ):
+        self.engine = engine
+        self.table = table
+        self.key = key
+        self.version_column = version_column
+        self.limit = limit
+        self._detected = version_column is not None
+        self._versions: Dict[Any, Any] = {}
+        self._rows: Dict[Any, Dict[str, Any]] = {}
+        # Re-entrant: refresh() checks staleness and polls under one hold, so
+        # concurrent HTTP requests and the socket loop share a single query
+        self._lock = threading.RLock()
+        self._payload: Optional[Serialized] = None
+        self._polled_at = float("-inf")
+        self.version = 0
+        self.polls = 0
+
+    def _window(self, columns: str) -> str:
+        query = f"SELECT {columns} FROM {self.table} ORDER BY {self.key}"
+        return query + (f" LIMIT {int(self.limit)}" if self.limit else "")
+
+    def _detect_version_column(self, conn) -> None:
+        self._detected = True
+        if self.engine.dialect.name == "sqlite":
+            return
+        for column in SYSTEM_VERSION_COLUMNS:
+            try:
+                with conn.begin_nested():
+                    conn.execute(text(f"SELECT {column} FROM {self.table} LIMIT 1"))
+                self.version_column = column
+                return
+            except Exception:
+                continue
+
+    def _read(self, conn) -> Dict[Any, Any]:
+        """Current key -> version for the window, loading full rows where needed."""
+        if not self._detected:
+            self._detect_version_column(conn)
+
+        if self.version_column is None:
+            rows = [serialize_row(dict(r._mapping)) for r in conn.execute(text(self._window("*")))]
+            versions = {}
+            for row in rows:
+                versions[row[self.key]] = row_digest(row)
+                if versions[row[self.key]] != self._versions.get(row[self.key]):
+                    self._rows[row[self.key]] = row
+            return versions
+
+        result = conn.execute(
+            text(self._window(f"{self.key}, {self.version_column} AS row_version"))
+        )
+        versions = {r[0]: str(r[1]) for r in result}
+        changed = [k for k, v in versions.items() if self._versions.get(k) != v]
+        if changed:
+            query = text(f"SELECT * FROM {self.table} WHERE {self.key} IN :keys").bindparams(
+                bindparam("keys", expanding=True)
+            )
+            for r in conn.execute(query, {"keys": changed}):
+                row = serialize_row(dict(r._mapping))
+                self._rows[row[self.key]] = row
+        return versions
+
+    def poll(self) -> RowChanges:
+        """Read the window once and return what changed since the previous poll."""
+        with self._lock:
+            with self.engine.connect() as conn:
+                versions = self._read(conn)
+
+            inserted = [self._rows[k] for k in versions if k not in self._versions]
+            updated = [
+                self._rows[k]
+                for k, v in versions.items()
+                if k in self._versions and self._versions[k] != v
+            ]
+            deleted = [k for k in self._versions if k not in versions]
+            for k in deleted:
+                self._rows.pop(k, None)
+
+            self._versions = versions
+            self._polled_at = time.monotonic()
+            self.polls += 1
+            changes = RowChanges(inserted, updated, deleted)
+            if changes:
+                self.version += 1
+                self._payload = None
+            return changes
+
+    def refresh(self, max_age: float) -> RowChanges:
+        """poll() unless the last poll is younger than max_age seconds."""
+        with self._lock:
+            if time.monotonic() - self._polled_at < max_age:
+                return RowChanges([], [], [])
+            return self.poll()
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Rows as of the last poll, in key order."""
+        with self._lock:
+            return [self._rows[k] for k in self._versions]
+
+    def payload(self) -> Serialized:
+        """The snapshot serialized once per change and shared by every reader."""
+        with self._lock:
+            if self._payload is None:
+                self._payload = Serialized([self._rows[k] for k in self._versions])
+            return self._payload
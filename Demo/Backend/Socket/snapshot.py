@@ -0,0 +1,38 @@
+import json
+from typing import Any
+
+
+class Serialized:
+    """A JSON value encoded once; SnapshotJSON splices the text in as-is."""
+
+    __slots__ = ("text", "body")
+
+    def __init__(self, value: Any):
+        self.text = json.dumps(value, separators=(",", ":"))
+        self.body = self.text.encode("utf-8")
+
+    def __len__(self) -> int:
+        return len(self.body)
+
+
+class SnapshotJSON:
+    """
+    json module for Socket.IO packets (SocketIO(json=SnapshotJSON)).
+
+    Works like the standard json module, except that Serialized values inside
+    the packet are written from their cached text instead of being encoded
+    again, so emitting the shared snapshot to many clients costs no
+    serialization per emit.
+    """
+
+    @staticmethod
+    def dumps(obj: Any, **kwargs) -> str:
+        if isinstance(obj, Serialized):
+            return obj.text
+        if isinstance(obj, (list, tuple)) and any(isinstance(i, Serialized) for i in obj):
+            return "[" + ",".join(SnapshotJSON.dumps(i, **kwargs) for i in obj) + "]"
+        return json.dumps(obj, **kwargs)
+
+    @staticmethod
+    def loads(s, **kwargs) -> Any:
+        return json.loads(s, **kwargs)
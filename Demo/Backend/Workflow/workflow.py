@@ -1,10 +1,7 @@
 
-from langchain_ollama import OllamaEmbeddings
 from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.memory import MemorySaver
 from langgraph.prebuilt import tools_condition as tc
-from langchain_core.messages import RemoveMessage
-from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from dotenv import load_dotenv
 import os
 from langgraph.prebuilt import ToolNode
@@ -13,34 +10,48 @@ import sys
 
 # Setting the system path so it could view other files within the directory
 sys.path.append(os.path.abspath(os.path.join(os.getcwd(), '..')))
-from tools.utility import tools
 from SingleAgent.singleAgent import Agent
+from utils.compaction import Compactor
+from utils.rate_limiter import estimate_tokens
+from utils.registry import registry
 from utils.utils import AgentState
 
 load_dotenv()
 
 class workflow:
-    def __init__(self):
-        self.memory = MemorySaver()
+    def __init__(self, model=None):
+        # SQLite-backed, shared by every workflow and worker process on this host
+        self.memory = registry.get("checkpointer")
         self.workflow = StateGraph(AgentState)
         self.graph = None
 
-        embeddings = OllamaEmbeddings(
-                            model="nomic-embed-text"
-                        )
-        self.Tools = tools()
-        self.singleAgent = Agent()
-
-
+        # Shared components come from the process-wide registry, so building
+        # another workflow does not reload the tools or reconnect the clients
+        self.embeddings = registry.get("embeddings")
+        self.Tools = registry.get("tools")
+        self.singleAgent = Agent(model)
+
+        # Trims old tool output and turns before each model call
+        self.compactor = Compactor(
+            keep_turns=int(os.getenv("HISTORY_KEEP_TURNS", "2")),
+            max_tokens=int(os.getenv("HISTORY_MAX_TOKENS", "8000")),
+            reserved_tokens=estimate_tokens([self.singleAgent.system_prompt()]),
+        )
 
         self.tools = ToolNode(self.Tools.toolkit())
         self.workflow_init()
         self.clear = self.clear_all_memory
         
     def workflow_init(self):
-        self.workflow.add_node("agent", self.singleAgent.run_agent)
+        self.workflow.add_node("compact", self.compactor)
+        # Sync and async entry points, so both invoke() and ainvoke() work
+        self.workflow.add_node(
+            "agent",
+            RunnableLambda(self.singleAgent.run_agent, afunc=self.singleAgent.arun_agent),
+        )
         self.workflow.add_node("tools_execution", self.tools)
-        self.workflow.set_entry_point("agent")
+        self.workflow.set_entry_point("compact")
+        self.workflow.add_edge("compact", "agent")
         self.workflow.add_conditional_edges(
             "agent",
             tc,
@@ -50,23 +61,23 @@ class workflow:
 
             },
         )
-        self.workflow.add_edge("tools_execution", "agent")
+        self.workflow.add_edge("tools_execution", "compact")
         self.graph = self.workflow.compile(checkpointer=self.memory)
         
     def get_graph(self):
         return self.graph
     
-    def clear_all_memory(config, graph01):
-      """Clears the conversation history."""
-      state = graph01.get_state(config)
-      if state and "messages" in state.values:
-          messages = state.values["messages"]
-          for msg in messages:
-            try:
-              remove_message = RemoveMessage(id=msg.id)
-              graph01.update_state(config, {"messages": remove_message})
-            except:
-              pass
+    def clear_all_memory(self, config):
+        """Clears the conversation history of one session in a single operation."""
+        self.memory.delete_thread(config["configurable"]["thread_id"])
+
+    def clear_sessions(self, session_ids):
+        """Clears many sessions at once; returns how many of them existed."""
+        return self.memory.delete_threads(session_ids)
+
+    def expire_sessions(self, idle_seconds):
+        """Clears every session idle for longer than idle_seconds; returns the count."""
+        return self.memory.expire_idle(idle_seconds)
 
 
 # if __name__ == "__main__":
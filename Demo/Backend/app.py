@@ -1,12 +1,18 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
-from langchain_core.messages import HumanMessage
-from Workflow.workflow import workflow
+from utils.registry import registry
+from utils.response_cache import ResponseCache, is_cacheable
 import os
 import sys
+import threading
 
 sys.path.append(os.path.abspath(os.path.join(os.getcwd(), "..")))
 import json
+import uuid
+
+# Importing this module stays cheap: langchain/langgraph, the model clients, numpy
+# and the graph itself are only loaded on first use or by warm_up(), so workers
+# boot quickly and /ready reports when they can serve without a cold start.
 
 JSON_DIR = os.path.join(os.getcwd(), "data")
 app = Flask(__name__)
@@ -15,13 +21,150 @@ CORS(
     resources={
         r"/ask": {"origins": "*"},
         r"/asic-data": {"origins": "*"},
+        r"/ask/cache": {"origins": "*"},
+        r"/ask/metrics": {"origins": "*"},
+        r"/ask/stream": {"origins": "*"},
+        r"/ask/batch": {"origins": "*"},
+        r"/components": {"origins": "*"},
+        r"/session/*": {"origins": "*"},
+        r"/sessions/*": {"origins": "*"},
+        r"/ready": {"origins": "*"},
     },
     supports_credentials=True,
 )
 
 
-graph_instance = workflow()
-graph = graph_instance.get_graph()
+# Final answers for identical requests against unchanged inventory
+response_cache = ResponseCache(
+    maxsize=int(os.getenv("ASK_CACHE_SIZE", "256")),
+    ttl=float(os.getenv("ASK_CACHE_TTL", "300")),
+)
+
+
+def _semantic_cache():
+    # Near-duplicate requests: identical structured fields, similar free text.
+    # The embedder is health-checked once here, whether the first build comes
+    # from warm_up() or from a request on a server that never warms up.
+    from utils.semantic_cache import SemanticCache
+
+    cache = SemanticCache(
+        registry.get("embeddings"),
+        threshold=float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.9")),
+        maxsize=int(os.getenv("SEMANTIC_CACHE_SIZE", "512")),
+    )
+    cache.check()
+    return cache
+
+
+registry.register("semantic_cache", _semantic_cache)
+
+MAX_BATCH_SCENARIOS = int(os.getenv("MAX_BATCH_SCENARIOS", "100"))
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "8"))
+SCENARIO_FIELDS = ("budget", "target_hashrate", "runtime_days")
+
+# Set when warm_up() fails, so /ready can say why instead of just "not yet"
+warmup_error = None
+_warmup_lock = threading.Lock()
+
+
+def get_workflow():
+    return registry.get("workflow")
+
+
+def get_graph():
+    return registry.get("graph")
+
+
+def get_semantic_cache():
+    return registry.get("semantic_cache")
+
+
+def warm_up():
+    """
+    Build everything a request needs: the compiled graph (with the model client,
+    tools and embeddings), the semantic cache (enabled once the embedder answers)
+    and the first inventory snapshots.
+    Safe to call more than once and from several threads.
+    """
+    global warmup_error
+    with _warmup_lock:
+        try:
+            Tools = get_workflow().Tools
+            get_graph()
+            semantic_cache = get_semantic_cache()
+            if not semantic_cache.enabled:
+                # Retry an embedder that was down when the cache was built
+                semantic_cache.check()
+            Tools.seller_tool.loader.get()
+            Tools.renter_tool.loader.get()
+            warmup_error = None
+        except Exception as e:
+            warmup_error = str(e)
+            print(f"Warm-up failed: {e}")
+    return registry.stats()
+
+
+def start_warm_up():
+    """Run warm_up() in the background so the server accepts connections meanwhile."""
+    thread = threading.Thread(target=warm_up, name="warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+def is_ready():
+    built = all(registry.is_built(name) for name in ("graph", "semantic_cache"))
+    return built and warmup_error is None
+
+
+def inventory_version():
+    """Version stamp of the seller/renter data the tools are currently serving."""
+    Tools = get_workflow().Tools
+    return (Tools.seller_tool.version, Tools.renter_tool.version)
+
+
+def is_first_turn(config):
+    """True when the session's thread has no messages yet."""
+    return not get_graph().get_state(config).values.get("messages")
+
+
+def lookup_cache(user_message, version, first_turn=False):
+    """Exact cache first, then the semantic cache; None on a miss or for a message that is not cacheable."""
+    if not is_cacheable(user_message, first_turn):
+        return None
+    cached = response_cache.get(user_message, version)
+    if cached is None:
+        cached = get_semantic_cache().get(user_message, version)
+        if cached is not None:
+            response_cache.put(user_message, version, cached)
+    return cached
+
+
+def cache_response(user_message, version, response_text, first_turn=False):
+    if not is_cacheable(user_message, first_turn):
+        return
+    response_cache.put(user_message, version, response_text)
+    get_semantic_cache().put(user_message, version, response_text)
+
+
+def cached_turn(user_message, response_text):
+    """Checkpoint update that records a cached answer as a normal turn of the session."""
+    from langchain_core.messages import AIMessage, HumanMessage
+
+    return {"messages": [HumanMessage(content=user_message), AIMessage(content=response_text)]}
+
+
+def record_cached_turn(config, user_message, response_text):
+    # Written as the agent's output, so the thread ends the turn like a real run
+    get_graph().update_state(config, cached_turn(user_message, response_text), as_node="agent")
+
+
+def store_response(user_message, version, result, first_turn=False):
+    """Extract the final answer from a graph result and cache it."""
+    messages = result.get("messages", [])
+    response_text = messages[-1].content if messages else "No response generated."
+    if messages:
+        cache_response(user_message, version, response_text, first_turn)
+    return response_text
 
 
 @app.route("/asic-data")
@@ -44,18 +187,233 @@ def ask_agent():
 
     config = {"configurable": {"session_id": session_id, "thread_id": session_id}}
     try:
+        version = inventory_version()
+        first_turn = is_first_turn(config)
+        cached = lookup_cache(user_message, version, first_turn)
+        if cached is not None:
+            record_cached_turn(config, user_message, cached)
+            return jsonify({"response": cached})
 
-        result = graph.invoke(
+        from langchain_core.messages import HumanMessage
+
+        result = get_graph().invoke(
             {"messages": [HumanMessage(content=user_message)]}, config=config
         )
-        messages = result.get("messages", [])
-        response_text = messages[-1].content if messages else "No response generated."
+        return jsonify({"response": store_response(user_message, version, result, first_turn)})
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/ask/stream", methods=["GET", "POST"])
+def ask_agent_stream():
+    """
+    Server-sent events version of /ask: progress events per graph step, model
+    tokens as they arrive, then a final "done" event with the full response.
+    """
+    data = request.get_json(silent=True) or request.args
+    session_id = data.get("session_id")
+    user_message = data.get("message")
+    if not session_id or not user_message:
+        return jsonify({"error": "Missing session_id or message"}), 400
+
+    config = {"configurable": {"session_id": session_id, "thread_id": session_id}}
+
+    from langchain_core.messages import HumanMessage
+    from utils.streaming import STREAM_MODES, sse, stream_events
+
+    def generate():
+        version = inventory_version()
+        first_turn = is_first_turn(config)
+        cached = lookup_cache(user_message, version, first_turn)
+        if cached is not None:
+            record_cached_turn(config, user_message, cached)
+            yield sse("done", {"response": cached})
+            return
+
+        stream = get_graph().stream(
+            {"messages": [HumanMessage(content=user_message)]},
+            config=config,
+            stream_mode=STREAM_MODES,
+        )
+        try:
+            for event, payload in stream_events(stream):
+                if event == "done":
+                    cache_response(user_message, version, payload["response"], first_turn)
+                yield sse(event, payload)
+        except Exception as e:
+            yield sse("error", {"error": str(e)})
+        finally:
+            # Also runs when the client disconnects (GeneratorExit on the next
+            # write): closing the graph stream stops any further model calls
+            stream.close()
 
-        return jsonify({"response": response_text})
+    return Response(
+        generate(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
+
+def scenario_error(scenario):
+    """Validation message for one batch scenario, or None when it is usable."""
+    if not isinstance(scenario, dict):
+        return "Scenario must be an object"
+    if "budget" not in scenario:
+        return "Budget is required"
+    for field in SCENARIO_FIELDS:
+        value = scenario.get(field)
+        if not isinstance(value, (int, float)) or isinstance(value, bool) or value <= 0:
+            return f"{field} must be a positive number"
+    return None
+
+
+@app.route("/ask/batch", methods=["POST"])
+def ask_agent_batch():
+    """
+    Evaluate many budget/hashrate/runtime scenarios in one call.
+
+    All scenarios share one inventory snapshot and its metric arrays; each one's
+    ranking is computed up front and handed to the agent with the request, and
+    the agent runs are fanned out with graph.batch under a concurrency cap.
+    Results come back in input order, each with its own response or error.
+    """
+    data = request.get_json(silent=True) or {}
+    scenarios = data.get("scenarios")
+    if not isinstance(scenarios, list) or not scenarios:
+        return jsonify({"error": "Missing scenarios"}), 400
+    if len(scenarios) > MAX_BATCH_SCENARIOS:
+        return jsonify({"error": f"At most {MAX_BATCH_SCENARIOS} scenarios per batch"}), 400
+
+    from langchain_core.messages import HumanMessage
+    from tools.ranking import rank_listings
+
+    Tools = get_workflow().Tools
+    snapshot = Tools.seller_tool.loader.get()
+    inventory = snapshot.index.inventory
+    version = (snapshot.version, Tools.renter_tool.version)
+    # Every call gets fresh threads, so scenarios never inherit an earlier call's
+    # history; they are deleted once the batch is answered
+    batch_id = f"{data.get('session_id') or 'batch'}-{uuid.uuid4().hex}"
+
+    results = [None] * len(scenarios)
+    pending, inputs, configs = [], [], []
+    for i, scenario in enumerate(scenarios):
+        error = scenario_error(scenario)
+        if error:
+            results[i] = {"index": i, "error": error}
+            continue
+        key = json.dumps(scenario, sort_keys=True)
+        cached = response_cache.get(key, version)
+        if cached is not None:
+            results[i] = {"index": i, "response": cached}
+            continue
+
+        ranked = rank_listings(
+            inventory,
+            scenario["budget"],
+            scenario["target_hashrate"],
+            int(scenario["runtime_days"]),
+        )
+        message = (
+            f"{key}\n\nrank_asics result for this input (already computed, "
+            f"do not call it again): {json.dumps({'Ranked Listings': ranked})}"
+        )
+        pending.append((i, key))
+        inputs.append({"messages": [HumanMessage(content=message)]})
+        configs.append(
+            {
+                "configurable": {"thread_id": f"{batch_id}-{i}"},
+                "max_concurrency": BATCH_CONCURRENCY,
+            }
+        )
+
+    if inputs:
+        try:
+            outputs = get_graph().batch(inputs, configs, return_exceptions=True)
+        finally:
+            get_workflow().clear_sessions([c["configurable"]["thread_id"] for c in configs])
+        for (i, key), output in zip(pending, outputs):
+            if isinstance(output, Exception):
+                results[i] = {"index": i, "error": str(output)}
+                continue
+            messages = output.get("messages", [])
+            response_text = messages[-1].content if messages else "No response generated."
+            if messages:
+                response_cache.put(key, version, response_text)
+            results[i] = {"index": i, "response": response_text}
+
+    return jsonify({"results": results})
+
+
+@app.route("/ask/cache", methods=["GET"])
+def ask_cache_stats():
+    return jsonify(
+        {"exact": response_cache.stats(), "semantic": get_semantic_cache().stats()}
+    )
+
+
+@app.route("/session/<session_id>", methods=["DELETE"])
+def clear_session(session_id):
+    """Reset one conversation: its checkpoints are deleted in a single transaction."""
+    try:
+        get_workflow().clear_all_memory({"configurable": {"thread_id": session_id}})
+        return jsonify({"cleared": session_id})
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/sessions/expire", methods=["POST"])
+def expire_sessions():
+    """
+    Bulk reset: {"session_ids": [...]} clears the listed sessions and/or
+    {"idle_seconds": N} clears every session idle for longer than N seconds.
+    """
+    data = request.get_json(silent=True) or {}
+    session_ids = data.get("session_ids")
+    idle_seconds = data.get("idle_seconds")
+    if session_ids is None and idle_seconds is None:
+        return jsonify({"error": "Missing session_ids or idle_seconds"}), 400
+    if session_ids is not None and not isinstance(session_ids, list):
+        return jsonify({"error": "session_ids must be a list"}), 400
+    if idle_seconds is not None and (
+        not isinstance(idle_seconds, (int, float)) or isinstance(idle_seconds, bool) or idle_seconds < 0
+    ):
+        return jsonify({"error": "idle_seconds must be a non-negative number"}), 400
+
+    try:
+        graph_instance = get_workflow()
+        cleared = 0
+        if session_ids:
+            cleared += graph_instance.clear_sessions([str(s) for s in session_ids])
+        if idle_seconds is not None:
+            cleared += graph_instance.expire_sessions(idle_seconds)
+        return jsonify({"cleared": cleared})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/ask/metrics", methods=["GET"])
+def ask_metrics():
+    """Prompt size per model call, before and after history compaction."""
+    return jsonify({"prompt": get_workflow().compactor.stats()})
+
+
+@app.route("/components", methods=["GET"])
+def component_stats():
+    """Which shared components are built and how long each took."""
+    return jsonify(registry.stats())
+
+
+@app.route("/ready", methods=["GET"])
+def ready():
+    """Readiness probe: 200 once warm_up() has built the graph and caches, 503 before."""
+    status = 200 if is_ready() else 503
+    return jsonify(
+        {"ready": status == 200, "error": warmup_error, "components": registry.stats()}
+    ), status
+
+
 if __name__ == "__main__":
+    start_warm_up()
     app.run(debug=True, port=5000)
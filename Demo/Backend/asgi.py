@@ -0,0 +1,191 @@
+import asyncio
+import json
+import os
+import sys
+
+from asgiref.wsgi import WsgiToAsgi
+
+sys.path.append(os.path.abspath(os.path.join(os.getcwd(), "..")))
+from app import app as flask_app
+from app import (
+    cache_response,
+    cached_turn,
+    get_graph,
+    inventory_version,
+    lookup_cache,
+    start_warm_up,
+    store_response,
+)
+
+# Async serving mode: run with `uvicorn asgi:application --port 5000`.
+# /ask and /ask/stream are driven with graph.ainvoke/astream on the event loop, so in-flight sessions wait
+# on the model without holding an OS thread each; every other route is served by
+# the Flask app through the WSGI adapter.
+wsgi_app = WsgiToAsgi(flask_app)
+
+
+async def read_body(receive) -> bytes:
+    body = b""
+    while True:
+        message = await receive()
+        body += message.get("body", b"")
+        if not message.get("more_body"):
+            return body
+
+
+async def send_json(send, status: int, payload) -> None:
+    body = json.dumps(payload).encode("utf-8")
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"access-control-allow-origin", b"*"),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def ask_agent(data):
+    """Async version of app.ask_agent; returns (status, payload)."""
+    session_id = data.get("session_id")
+    user_message = data.get("message")
+    if not session_id or not user_message:
+        return 400, {"error": "Missing session_id or message"}
+
+    config = {"configurable": {"session_id": session_id, "thread_id": session_id}}
+    try:
+        # On a cold worker these wait for warm_up() to finish building the
+        # workflow and graph, so they must not hold the event loop
+        graph = await asyncio.to_thread(get_graph)
+        version = await asyncio.to_thread(inventory_version)
+        first_turn = not (await graph.aget_state(config)).values.get("messages")
+        # The semantic cache may call the embedding server, so keep it off the loop
+        cached = await asyncio.to_thread(lookup_cache, user_message, version, first_turn)
+        if cached is not None:
+            await graph.aupdate_state(
+                config, cached_turn(user_message, cached), as_node="agent"
+            )
+            return 200, {"response": cached}
+
+        from langchain_core.messages import HumanMessage
+
+        result = await graph.ainvoke(
+            {"messages": [HumanMessage(content=user_message)]}, config=config
+        )
+        response_text = await asyncio.to_thread(
+            store_response, user_message, version, result, first_turn
+        )
+        return 200, {"response": response_text}
+
+    except Exception as e:
+        return 500, {"error": str(e)}
+
+
+async def ask_agent_stream(data, receive, send) -> None:
+    """
+    SSE version of ask_agent driven by graph.astream. A watcher waits for the
+    client's http.disconnect and cancels the run, which also cancels the model
+    call that is in flight.
+    """
+    session_id = data.get("session_id")
+    user_message = data.get("message")
+    if not session_id or not user_message:
+        return await send_json(send, 400, {"error": "Missing session_id or message"})
+
+    config = {"configurable": {"session_id": session_id, "thread_id": session_id}}
+    from langchain_core.messages import HumanMessage
+    from utils.streaming import STREAM_MODES, astream_events, sse
+
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"text/event-stream"),
+                (b"cache-control", b"no-cache"),
+                (b"access-control-allow-origin", b"*"),
+            ],
+        }
+    )
+
+    async def emit(event, payload) -> None:
+        body = sse(event, payload).encode("utf-8")
+        await send({"type": "http.response.body", "body": body, "more_body": True})
+
+    async def produce() -> None:
+        try:
+            graph = await asyncio.to_thread(get_graph)
+            version = await asyncio.to_thread(inventory_version)
+            first_turn = not (await graph.aget_state(config)).values.get("messages")
+            cached = await asyncio.to_thread(lookup_cache, user_message, version, first_turn)
+            if cached is not None:
+                await graph.aupdate_state(
+                    config, cached_turn(user_message, cached), as_node="agent"
+                )
+                return await emit("done", {"response": cached})
+
+            stream = graph.astream(
+                {"messages": [HumanMessage(content=user_message)]},
+                config=config,
+                stream_mode=STREAM_MODES,
+            )
+            async for event, payload in astream_events(stream):
+                if event == "done":
+                    await asyncio.to_thread(
+                        cache_response, user_message, version, payload["response"], first_turn
+                    )
+                await emit(event, payload)
+        except Exception as e:
+            await emit("error", {"error": str(e)})
+
+    async def disconnected() -> None:
+        while (await receive())["type"] != "http.disconnect":
+            pass
+
+    producer = asyncio.create_task(produce())
+    watcher = asyncio.create_task(disconnected())
+    done, _ = await asyncio.wait(
+        {producer, watcher}, return_when=asyncio.FIRST_COMPLETED
+    )
+    watcher.cancel()
+    if watcher in done:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+        print(f"Client disconnected, cancelled run for session {session_id}")
+        return
+    await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+async def lifespan(receive, send) -> None:
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            # Accept connections right away; /ready turns 200 once the graph is built
+            if os.getenv("WARM_UP_ON_START", "1") == "1":
+                start_warm_up()
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def application(scope, receive, send):
+    if scope["type"] == "lifespan":
+        return await lifespan(receive, send)
+
+    routes = ("/ask", "/ask/stream")
+    if scope["type"] == "http" and scope["path"] in routes and scope["method"] == "POST":
+        try:
+            data = json.loads(await read_body(receive) or b"{}")
+        except ValueError:
+            return await send_json(send, 400, {"error": "Invalid JSON body"})
+        if scope["path"] == "/ask/stream":
+            return await ask_agent_stream(data, receive, send)
+        status, payload = await ask_agent(data)
+        return await send_json(send, status, payload)
+
+    await wsgi_app(scope, receive, send)
@@ -0,0 +1,90 @@
+"""
+Compare the thread-per-request /ask mode with the async (ainvoke) mode.
+
+Both modes drive the real compiled graph (agent -> rank_asics -> agent) with the
+model replaced by StubChatModel, so the numbers isolate serving overhead from
+Mistral latency.
+
+    python benchmarks/bench_async_ask.py --requests 200 --latency 0.2
+"""
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Keep the shared rate limiter out of the measurement
+os.environ.setdefault("MISTRAL_REQUESTS_PER_SECOND", "1000000")
+os.environ.setdefault("MISTRAL_TOKENS_PER_MINUTE", "1000000000000")
+os.environ.setdefault("EMBEDDINGS", "local")
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_core.messages import HumanMessage
+
+from benchmarks.stub_model import StubChatModel
+from Workflow.workflow import workflow
+
+
+class ThreadPeak:
+    """Samples threading.active_count() while a benchmark runs."""
+
+    def __init__(self):
+        self.peak = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(0.005):
+            self.peak = max(self.peak, threading.active_count())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def request(i: int, mode: str):
+    config = {"configurable": {"thread_id": f"{mode}-{i}"}}
+    message = HumanMessage(content='{"budget": 200, "target_hashrate": 1000, "runtime_days": 30}')
+    return {"messages": [message]}, config
+
+
+def run_sync(graph, n: int):
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        list(pool.map(lambda i: graph.invoke(*request(i, "sync")), range(n)))
+
+
+async def run_async(graph, n: int):
+    await asyncio.gather(*(graph.ainvoke(*request(i, "async")) for i in range(n)))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    graph = workflow(model=StubChatModel(latency=args.latency)).get_graph()
+    graph.invoke(*request(-1, "warmup"))
+
+    for mode in ("sync", "async"):
+        with ThreadPeak() as threads:
+            start = time.perf_counter()
+            if mode == "sync":
+                run_sync(graph, args.requests)
+            else:
+                asyncio.run(run_async(graph, args.requests))
+            elapsed = time.perf_counter() - start
+        print(
+            f"{mode:>5}: {args.requests} requests in {elapsed:.2f}s "
+            f"({args.requests / elapsed:.1f} req/s), peak threads {threads.peak}"
+        )
+
+
+if __name__ == "__main__":
+    main()
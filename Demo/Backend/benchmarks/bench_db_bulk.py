@@ -0,0 +1,82 @@
+"""
+Bulk write benchmark: per-row insert_candidate/delete_candidate against the
+batched insert_candidates/delete_candidates paths of CockroachDBAgent.
+
+Any URL open_agent() understands works, including the local SQLite stand-in.
+
+    python benchmarks/bench_db_bulk.py --rows 2000 --batch-size 500
+    python benchmarks/bench_db_bulk.py --url sqlite:///Data/bench.sqlite
+"""
+import argparse
+import os
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from CockroachDB.backend import open_agent
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def report(label, rows, seconds):
+    print(f"{label:<28} {rows:>7} rows  {seconds:8.3f} s  {rows / seconds:10.1f} rows/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    if not args.url:
+        parser.error("pass --url or set DATABASE_URL")
+
+    db = open_agent(args.url)
+    candidates = [(f"First{i}", f"Last{i}", f"bench candidate {i}") for i in range(args.rows)]
+    # Ids still in the table, removed at the end even if a step fails
+    live = set()
+
+    def insert_per_row():
+        for candidate in candidates:
+            live.add(db.insert_candidate(*candidate))
+
+    def delete_per_row(ids):
+        for candidate_id in ids:
+            db.delete_candidate(candidate_id)
+            live.discard(candidate_id)
+
+    try:
+        _, seconds = timed(insert_per_row)
+        report("insert_candidate (per row)", args.rows, seconds)
+
+        ids = sorted(live)
+        _, seconds = timed(lambda: delete_per_row(ids))
+        report("delete_candidate (per row)", len(ids), seconds)
+
+        ids, seconds = timed(lambda: db.insert_candidates(candidates, args.batch_size))
+        live.update(ids)
+        report("insert_candidates (bulk)", len(ids), seconds)
+
+        deleted, seconds = timed(lambda: db.delete_candidates(ids, args.batch_size))
+        live.difference_update(ids)
+        report("delete_candidates (bulk)", deleted, seconds)
+    finally:
+        if live:
+            db.delete_candidates(sorted(live))
+        stats = db.stats()
+        stats["transactions"].pop("recent")
+        print(stats)
+        db.close()
+
+if __name__ == "__main__":
+    main()
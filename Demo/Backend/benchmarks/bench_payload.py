@@ -0,0 +1,48 @@
+"""
+Tool payload report: bytes and approximate tokens one seller + renter retrieval
+adds to the conversation, measured with tools.encoding.payload_size.
+
+"full records" is what the tools used to return (every column, one dict per
+listing); the other rows are the projected outputs of retrieve().
+
+    python benchmarks/bench_payload.py
+"""
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.encoding import payload_size
+from tools.renterTool import renterTool
+from tools.sellerTool import sellerTool
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Data")
+
+
+def report(label, seller_output, renter_output):
+    seller = payload_size(seller_output)
+    renter = payload_size(renter_output)
+    total = seller["bytes"] + renter["bytes"]
+    print(
+        f"{label:<16} seller {seller['bytes']:>7,} B  renter {renter['bytes']:>6,} B  "
+        f"total {total:>7,} B  ~{total // 4:>6,} tokens"
+    )
+    return total
+
+
+def main():
+    seller = sellerTool(os.path.join(DATA_DIR, "seller_data.json"))
+    renter = renterTool(os.path.join(DATA_DIR, "buyer_data.json"))
+
+    before = report(
+        "full records",
+        {"Retrieved Data": seller.loader.get().records},
+        {"Retrieved Data": renter.loader.get().records},
+    )
+    report("projected dicts", seller.retrieve(compact=False), renter.retrieve(compact=False))
+    after = report("projected table", seller.retrieve(), renter.retrieve())
+    print(f"\nDefault retrieval is {1 - after / before:.0%} smaller than the full records.")
+
+
+if __name__ == "__main__":
+    main()
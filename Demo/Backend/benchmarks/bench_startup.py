@@ -0,0 +1,121 @@
+"""
+Startup report: how long importing the server entry points takes, from
+`python -X importtime`, checked against benchmarks/startup_budget.json.
+
+Each module is imported in a fresh interpreter a few times and the median
+cumulative import time is compared with its budget. Modules listed as forbidden
+(the heavy langchain/langgraph/numpy/database stacks) must not be loaded at
+import time at all; they belong to warm_up() or the first request. Exits with
+status 1 on any regression, so it can run in CI.
+
+    python benchmarks/bench_startup.py --runs 5
+    python benchmarks/bench_startup.py --update   # rewrite the time budgets
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_PATH = os.path.join(BACKEND_DIR, "benchmarks", "startup_budget.json")
+
+# "import time:       self [us] |  cumulative | imported package"
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+# --update sets each budget to this multiple of the measured median
+HEADROOM = 2.0
+
+
+def import_profile(module):
+    """One cold import in a fresh interpreter: [(depth, name, self_us, cumulative_us)]."""
+    env = dict(os.environ, PYTHONPATH=BACKEND_DIR)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{proc.stderr[-2000:]}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((len(indent) // 2, name, int(self_us), int(cumulative_us)))
+    return rows
+
+
+def measure(module, runs):
+    totals, profile = [], []
+    for _ in range(runs):
+        profile = import_profile(module)
+        totals.append(next(c for d, n, _, c in profile if d == 0 and n == module))
+
+    loaded = {name.split(".")[0] for _, name, _, _ in profile}
+    # Direct imports of the entry point, slowest first. importtime prints a
+    # module after its children, so they are the depth-1 rows just above it.
+    end = next(i for i, (d, n, _, _) in enumerate(profile) if d == 0 and n == module)
+    start = max((i for i in range(end) if profile[i][0] == 0), default=-1) + 1
+    children = sorted(
+        ((c, n) for d, n, _, c in profile[start:end] if d == 1), reverse=True
+    )
+    return {
+        "median_ms": statistics.median(totals) / 1000,
+        "runs_ms": [t / 1000 for t in totals],
+        "loaded": loaded,
+        "slowest": children[:8],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--update", action="store_true", help="rewrite the time budgets")
+    args = parser.parse_args()
+
+    with open(BUDGET_PATH) as f:
+        budgets = json.load(f)
+
+    failures = []
+    for module, budget in budgets.items():
+        result = measure(module, args.runs)
+        forbidden = sorted(set(budget.get("forbidden", [])) & result["loaded"])
+
+        print(f"\n{module}: median {result['median_ms']:.1f} ms over {args.runs} runs "
+              f"(budget {budget['max_import_ms']} ms)")
+        for cumulative, name in result["slowest"]:
+            print(f"  {cumulative / 1000:8.1f} ms  {name}")
+        if forbidden:
+            print(f"  heavy modules loaded at import: {', '.join(forbidden)}")
+            failures.append(f"{module} imports {', '.join(forbidden)}")
+
+        if args.update:
+            budget["max_import_ms"] = int(result["median_ms"] * HEADROOM) + 1
+        elif result["median_ms"] > budget["max_import_ms"]:
+            failures.append(
+                f"{module} took {result['median_ms']:.1f} ms "
+                f"(budget {budget['max_import_ms']} ms)"
+            )
+
+    if args.update:
+        with open(BUDGET_PATH, "w") as f:
+            json.dump(budgets, f, indent=2)
+            f.write("\n")
+        print(f"\nUpdated {BUDGET_PATH}")
+
+    if failures:
+        print("\nStartup regression:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\nStartup within budget.")
+
+
+if __name__ == "__main__":
+    main()
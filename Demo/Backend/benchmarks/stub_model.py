@@ -0,0 +1,113 @@
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Iterator, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+# Streaming splits the reply into this many chunks spread over the latency
+STREAM_CHUNKS = 8
+
+FINAL_ANSWER = json.dumps(
+    {
+        "top_3_asic_models": ["WhatsMiner M63", "Antminer S21", "Antminer S19 Pro Hydro"],
+        "recommended_rental_duration": "30 days",
+        "budget_envelope": "$200/day",
+    }
+)
+
+
+class StubChatModel(BaseChatModel):
+    """
+    Stand-in for ChatMistralAI with a fixed latency and no network access.
+
+    The first turn of a request asks for rank_asics; once a tool result is in the
+    conversation it answers with a fixed recommendation, so every request makes
+    the same agent -> tools -> agent round trip as the real model.
+    """
+
+    latency: float = 0.2
+
+    @property
+    def _llm_type(self) -> str:
+        return "stub"
+
+    def bind_tools(self, tools: Any, **kwargs: Any) -> "StubChatModel":
+        return self
+
+    def _reply(self, messages: List[BaseMessage]) -> AIMessage:
+        if isinstance(messages[-1], HumanMessage):
+            return AIMessage(
+                content="",
+                tool_calls=[
+                    {
+                        "name": "rank_asics",
+                        "args": {"budget": 200, "target_hashrate": 1000, "runtime_days": 30},
+                        "id": "rank00001",
+                    }
+                ],
+            )
+        return AIMessage(content=FINAL_ANSWER)
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        time.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._reply(messages))])
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        reply = self._reply(messages)
+        for chunk in self._chunks(reply):
+            time.sleep(self.latency / STREAM_CHUNKS)
+            if run_manager:
+                run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        reply = self._reply(messages)
+        for chunk in self._chunks(reply):
+            await asyncio.sleep(self.latency / STREAM_CHUNKS)
+            if run_manager:
+                await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+
+    def _chunks(self, reply: AIMessage) -> List[ChatGenerationChunk]:
+        if reply.tool_calls:
+            tool_chunks = [
+                {"name": c["name"], "args": json.dumps(c["args"]), "id": c["id"], "index": 0}
+                for c in reply.tool_calls
+            ]
+            return [ChatGenerationChunk(message=AIMessageChunk(content="", tool_call_chunks=tool_chunks))]
+        size = max(1, len(reply.content) // STREAM_CHUNKS + 1)
+        return [
+            ChatGenerationChunk(message=AIMessageChunk(content=reply.content[i : i + size]))
+            for i in range(0, len(reply.content), size)
+        ]
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        await asyncio.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._reply(messages))])
@@ -0,0 +1,174 @@
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from tools.inventory import AsicInventory
+
+
+# (user, model, location, hashrate, power, daily price, quantity)
+Listing = Tuple[str, str, str, float, float, float, int]
+
+
+def _median(values: List[Tuple[float, str]]) -> Optional[float]:
+    if not values:
+        return None
+    mid = len(values) // 2
+    if len(values) % 2:
+        return values[mid][0]
+    return (values[mid - 1][0] + values[mid][0]) / 2
+
+
+def _discard(values: List[Tuple[Any, str]], item: Tuple[Any, str]) -> None:
+    i = bisect_left(values, item)
+    if i < len(values) and values[i] == item:
+        del values[i]
+
+
+def listings(inventory: AsicInventory) -> Iterator[Listing]:
+    """Yield one plain tuple per inventory row."""
+    users = inventory.column("User ID")
+    models = inventory.column("Model")
+    locations = inventory.column("Location")
+    yield from zip(
+        users,
+        models,
+        locations,
+        inventory.hashrate.tolist(),
+        inventory.power.tolist(),
+        inventory.daily_price.tolist(),
+        inventory.quantity.tolist(),
+    )
+
+
+class _ModelGroup:
+    def __init__(self):
+        self.units = 0
+        # Sorted (value, user) pairs so entries can be removed exactly
+        self.prices: List[Tuple[float, str]] = []
+        self.hashrates: List[Tuple[float, str]] = []
+        self.powers: List[Tuple[float, str]] = []
+        self.by_location: Dict[str, List[Tuple[float, str]]] = {}
+
+    def copy(self) -> "_ModelGroup":
+        group = _ModelGroup()
+        group.units = self.units
+        group.prices = list(self.prices)
+        group.hashrates = list(self.hashrates)
+        group.powers = list(self.powers)
+        group.by_location = {loc: list(v) for loc, v in self.by_location.items()}
+        return group
+
+
+class ModelSummary:
+    """
+    Inventory aggregated by ASIC model, maintained incrementally.
+
+    Each model keeps its unit count and sorted price/hashrate/power lists, plus a
+    sorted price list per location, so adding or removing one listing only touches
+    its own group and min/median/cheapest-seller lookups stay cheap. updated()
+    returns a new summary that shares every untouched group with the old one, so a
+    published summary is never modified in place.
+    """
+
+    COLUMNS = [
+        "Model",
+        "Listings",
+        "Units",
+        "Min Daily Price ($)",
+        "Median Daily Price ($)",
+        "Hashrate (TH/s)",
+        "Power (W)",
+        "Cheapest Seller By Location (seller, daily price)",
+    ]
+
+    def __init__(self):
+        self._groups: Dict[str, _ModelGroup] = {}
+        # Groups this instance may mutate; the rest are shared with an older summary
+        self._owned = set()
+
+    def _writable(self, model: str) -> _ModelGroup:
+        group = self._groups.get(model)
+        if group is None:
+            group = self._groups[model] = _ModelGroup()
+        elif model not in self._owned:
+            group = self._groups[model] = group.copy()
+        self._owned.add(model)
+        return group
+
+    @classmethod
+    def from_inventory(cls, inventory: AsicInventory) -> "ModelSummary":
+        summary = cls()
+        for listing in listings(inventory):
+            summary.add(listing)
+        return summary
+
+    def add(self, listing: Listing) -> None:
+        user, model, location, hashrate, power, price, quantity = listing
+        group = self._writable(model)
+        group.units += quantity
+        insort(group.prices, (price, user))
+        insort(group.hashrates, (hashrate, user))
+        insort(group.powers, (power, user))
+        insort(group.by_location.setdefault(location, []), (price, user))
+
+    def remove(self, listing: Listing) -> None:
+        user, model, location, hashrate, power, price, quantity = listing
+        if model not in self._groups:
+            return
+        group = self._writable(model)
+        group.units -= quantity
+        _discard(group.prices, (price, user))
+        _discard(group.hashrates, (hashrate, user))
+        _discard(group.powers, (power, user))
+        sellers = group.by_location.get(location, [])
+        _discard(sellers, (price, user))
+        if not sellers:
+            group.by_location.pop(location, None)
+        if not group.prices:
+            del self._groups[model]
+            self._owned.discard(model)
+
+    def updated(self, old: AsicInventory, new: AsicInventory) -> "ModelSummary":
+        """Return a summary of `new`, applying only the listings that differ from `old`."""
+        summary = ModelSummary()
+        summary._groups = dict(self._groups)
+        # Multisets of whole listings: one seller can list several models, and
+        # identical listings can repeat
+        before = Counter(listings(old))
+        after = Counter(listings(new))
+        for listing, count in (before - after).items():
+            for _ in range(count):
+                summary.remove(listing)
+        for listing, count in (after - before).items():
+            for _ in range(count):
+                summary.add(listing)
+        return summary
+
+    def rows(self, location: Optional[str] = None) -> List[List[Any]]:
+        """One row per model, ordered by minimum daily price."""
+        rows = []
+        for model, group in self._groups.items():
+            if location is not None and location not in group.by_location:
+                continue
+            cheapest = {
+                loc: [sellers[0][1], sellers[0][0]]
+                for loc, sellers in group.by_location.items()
+                if location is None or loc == location
+            }
+            rows.append(
+                [
+                    model,
+                    len(group.prices),
+                    group.units,
+                    group.prices[0][0],
+                    _median(group.prices),
+                    _median(group.hashrates),
+                    _median(group.powers),
+                    cheapest,
+                ]
+            )
+        rows.sort(key=lambda row: row[3])
+        return rows
+
+    def __len__(self) -> int:
+        return len(self._groups)
@@ -1,19 +1,27 @@
 import sys 
 import os
-from typing import Dict
+from typing import Dict, List
 
 from dotenv import load_dotenv
 load_dotenv()
 
 sys.path.append(os.path.abspath(os.path.join(os.getcwd(), '..')))
 
-from CockroachDB.cockroachDB import CockroachDBAgent
+from CockroachDB.backend import BulkWriteError, open_agent, open_async_agent
 
 
 class delete: 
     def __init__(self, connection_string): 
         self.connection_string = connection_string
-        self.db = CockroachDBAgent(self.connection_string)
+        self.db = open_agent(self.connection_string)
+        self._adb = None
+
+    # Async agent for the coroutine tools, created on first use
+    @property
+    def adb(self):
+        if self._adb is None:
+            self._adb = open_async_agent(self.connection_string)
+        return self._adb
 
     def delete(self, id: str) -> Dict[str, str]:
         """
@@ -21,9 +29,11 @@ class delete:
         """
         # Placeholder for actual database retrieval logic
         # In a real implementation, this would query the database and return the result
-        self.db.connect()
-        retrived_data = self.db.delete_candidate(id)
-        if retrived_data == None: 
+        try:
+            deleted = self.db.delete_candidate(id)
+        except Exception as e:
+            return {"error": str(e)}
+        if deleted: 
             retrived_data = "Canidate Successsully deleted"
         else:
             retrived_data = "Cannot find data with the given ID"
@@ -32,6 +42,47 @@ class delete:
         return {
             "Data" : retrived_data
         }
+
+    def delete_many(self, ids: List[str]) -> Dict[str, str]:
+        """
+        Delete several candidates from the database by their IDs in one call.
+        """
+        try:
+            deleted = self.db.delete_candidates(ids)
+        except BulkWriteError as e:
+            return {"error": str(e), "Deleted": e.completed}
+        except Exception as e:
+            return {"error": str(e)}
+        return {
+            "Data" : f"{deleted} of {len(ids)} candidates deleted"
+        }
+
+    # Coroutine versions for async graph execution: the DB wait does not hold a thread
+    async def adelete(self, id: str) -> Dict[str, str]:
+        """
+        Delete a candidate from the database by ID.
+        """
+        try:
+            deleted = await self.adb.delete_candidate(id)
+        except Exception as e:
+            return {"error": str(e)}
+        return {
+            "Data" : "Canidate Successsully deleted" if deleted else "Cannot find data with the given ID"
+        }
+
+    async def adelete_many(self, ids: List[str]) -> Dict[str, str]:
+        """
+        Delete several candidates from the database by their IDs in one call.
+        """
+        try:
+            deleted = await self.adb.delete_candidates(ids)
+        except BulkWriteError as e:
+            return {"error": str(e), "Deleted": e.completed}
+        except Exception as e:
+            return {"error": str(e)}
+        return {
+            "Data" : f"{deleted} of {len(ids)} candidates deleted"
+        }
     
 if __name__ == "__main__":
     delet = delete(os.getenv("DATABASE_URL"))
@@ -0,0 +1,31 @@
+import json
+from typing import Any, Dict, List, Sequence
+
+
+def compact_table(columns: Sequence[str], rows: List[List[Any]]) -> Dict[str, Any]:
+    """Columnar encoding sent to the model: one header plus positional rows."""
+    return {"columns": list(columns), "rows": rows}
+
+
+def project_records(
+    records: List[Dict[str, Any]], fields: Sequence[str]
+) -> List[List[Any]]:
+    """Keep only the given fields of each record, as positional rows."""
+    return [[record.get(field) for field in fields] for record in records]
+
+
+def missing_fields(available: Sequence[str], fields: Sequence[str]) -> List[str]:
+    available = set(available)
+    return [field for field in fields if field not in available]
+
+
+def payload_size(output: Any) -> Dict[str, int]:
+    """
+    Size of a tool output once it is serialized into a ToolMessage.
+
+    ToolNode dumps non-string outputs with json.dumps(ensure_ascii=False); tokens
+    are approximated at four bytes each.
+    """
+    text = output if isinstance(output, str) else json.dumps(output, ensure_ascii=False)
+    size = len(text.encode("utf-8"))
+    return {"bytes": size, "approx_tokens": size // 4}
@@ -1,28 +1,87 @@
 import sys 
 import os
-from typing import Dict
-import psycopg2
+from typing import Any, Dict, List
 from dotenv import load_dotenv
 load_dotenv()
 
 sys.path.append(os.path.abspath(os.path.join(os.getcwd(), '..')))
 
-from CockroachDB.cockroachDB import CockroachDBAgent
+from CockroachDB.backend import BulkWriteError, open_agent, open_async_agent
+
+
+def candidate_rows(candidates):
+    return [(c["first_name"], c["last_name"], c["description"]) for c in candidates]
 
 
 class insert: 
     def __init__(self, connection_string): 
         self.connection_string = connection_string
         # Establishing the connection for the coackroachDB
-        self.db = CockroachDBAgent(self.connection_string)
+        self.db = open_agent(self.connection_string)
+        self._adb = None
+
+    # Async agent for the coroutine tools, created on first use
+    @property
+    def adb(self):
+        if self._adb is None:
+            self._adb = open_async_agent(self.connection_string)
+        return self._adb
 
     # Tool that is used to help insert the data into the database
-    def insert_canidate(self, first_name: str, last_name: str, query: str)-> Dict[str, str]: 
+    def insert_canidate(self, first_name: str, last_name: str, query: str)-> Dict[str, Any]: 
+        """ This will be the tool to help insert any new canidates onto the database itsef"""
+        try:
+            candidate_id = self.db.insert_candidate(first_name, last_name, query)
+        except Exception as e:
+            return {"error": str(e)}
+        return { "Response": f"Candidate with description '{query}' inserted successfully!",
+                 "ID": candidate_id
+        }
+
+    # Tool for loading many candidates at once
+    def insert_canidates(self, candidates: List[Dict[str, str]]) -> Dict[str, Any]:
+        """ Insert many candidates in one call. Each candidate needs "first_name", "last_name" and "description"."""
+        try:
+            rows = candidate_rows(candidates)
+        except (KeyError, TypeError) as e:
+            return {"error": f"Each candidate needs first_name, last_name and description: {e}"}
+        try:
+            ids = self.db.insert_candidates(rows)
+        except BulkWriteError as e:
+            return {"error": str(e), "Inserted IDs": e.completed}
+        except Exception as e:
+            return {"error": str(e)}
+        return {
+            "Response": f"{len(ids)} of {len(rows)} candidates inserted successfully!",
+            "Inserted IDs": ids,
+        }
+
+    # Coroutine versions for async graph execution: the DB wait does not hold a thread
+    async def ainsert_canidate(self, first_name: str, last_name: str, query: str) -> Dict[str, Any]:
         """ This will be the tool to help insert any new canidates onto the database itsef"""
-        # WE need to hardcode the connection just so the agent can will be able to connect to the database itself
-        self.db.connect()
-        self.db.insert_candidate(first_name, last_name, query)
-        return { "Response": "Candidate with description '{query}' inserted successfully!"
+        try:
+            candidate_id = await self.adb.insert_candidate(first_name, last_name, query)
+        except Exception as e:
+            return {"error": str(e)}
+        return { "Response": f"Candidate with description '{query}' inserted successfully!",
+                 "ID": candidate_id
+        }
+
+    async def ainsert_canidates(self, candidates: List[Dict[str, str]]) -> Dict[str, Any]:
+        """ Insert many candidates in one call. Each candidate needs "first_name", "last_name" and "description"."""
+        try:
+            rows = candidate_rows(candidates)
+        except (KeyError, TypeError) as e:
+            return {"error": f"Each candidate needs first_name, last_name and description: {e}"}
+        try:
+            ids = await self.adb.insert_candidates(rows)
+        except BulkWriteError as e:
+            return {"error": str(e), "Inserted IDs": e.completed}
+        except Exception as e:
+            return {"error": str(e)}
+        return {
+            "Response": f"{len(ids)} of {len(rows)} candidates inserted successfully!",
+            "Inserted IDs": ids,
         }
     
 
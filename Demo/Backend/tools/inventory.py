@@ -0,0 +1,195 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+
+# Column names used by the seller listings. The hashrate key is written with an
+# escaped slash in some sources, so both spellings are accepted when loading.
+USER_ID = "User ID"
+LOCATION = "Location"
+MODEL = "Model"
+HASHRATE = "Hashrate (TH/s)"
+POWER = "Power (W)"
+DAILY_PRICE = "Estimated Total Daily Rental Price ($)"
+HOURLY_PRICE = "Estimated Hourly Rental Price ($)"
+QUANTITY = "Quantity Available"
+
+_ALIASES = {
+    HASHRATE: (HASHRATE, "Hashrate (TH\\/s)"),
+}
+
+# Typed numeric columns: attribute name -> (column name, dtype)
+_NUMERIC = {
+    "hashrate": (HASHRATE, np.float64),
+    "power": (POWER, np.float64),
+    "daily_price": (DAILY_PRICE, np.float64),
+    "hourly_price": (HOURLY_PRICE, np.float64),
+    "quantity": (QUANTITY, np.int64),
+}
+
+# Categorical columns: attribute name -> column name
+_CATEGORICAL = {
+    "model": MODEL,
+    "location": LOCATION,
+    "user": USER_ID,
+}
+
+
+def _lookup(record: Dict[str, Any], column: str) -> Any:
+    for key in _ALIASES.get(column, (column,)):
+        if key in record:
+            return record[key]
+    return None
+
+
+def _encode(values: Sequence[Any]):
+    """Intern a sequence of labels into (codes, categories) keeping first-seen order."""
+    index: Dict[Any, int] = {}
+    codes = np.empty(len(values), dtype=np.int32)
+    for i, value in enumerate(values):
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(index)
+        codes[i] = code
+    return codes, list(index)
+
+
+class AsicInventory:
+    """
+    Columnar store for the ASIC marketplace listings.
+
+    Numeric fields live in typed NumPy arrays and model/location/user are kept as
+    categorical codes, so filters and metrics run as array operations instead of
+    loops over a list of dicts. The remaining fields are kept as plain columns so
+    the original dict view can still be produced.
+    """
+
+    def __init__(
+        self,
+        keys: List[str],
+        numeric: Dict[str, np.ndarray],
+        codes: Dict[str, np.ndarray],
+        categories: Dict[str, List[Any]],
+        extra: Dict[str, List[Any]],
+        integral: Optional[Dict[str, bool]] = None,
+    ):
+        self.keys = keys
+        self.hashrate = numeric["hashrate"]
+        self.power = numeric["power"]
+        self.daily_price = numeric["daily_price"]
+        self.hourly_price = numeric["hourly_price"]
+        self.quantity = numeric["quantity"]
+        self.model_codes = codes["model"]
+        self.location_codes = codes["location"]
+        self.user_codes = codes["user"]
+        self.models = categories["model"]
+        self.locations = categories["location"]
+        self.users = categories["user"]
+        self._extra = extra
+        # Float columns whose source values were all integers come back as ints
+        self._integral = integral or {}
+        self._metrics: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "AsicInventory":
+        """Build the inventory from a list of listing dicts."""
+        records = list(records)
+        keys = list(records[0]) if records else []
+
+        numeric, integral = {}, {}
+        for name, (column, dtype) in _NUMERIC.items():
+            values = [_lookup(r, column) or 0 for r in records]
+            numeric[name] = np.array(values, dtype=dtype)
+            integral[name] = all(
+                isinstance(v, (int, np.integer)) and not isinstance(v, bool) for v in values
+            )
+
+        codes, categories = {}, {}
+        for name, column in _CATEGORICAL.items():
+            codes[name], categories[name] = _encode([r.get(column) for r in records])
+
+        # Everything that is not typed or categorical is kept as-is
+        typed = {column for column, _ in _NUMERIC.values()}
+        typed.update(_CATEGORICAL.values())
+        typed.update(alias for aliases in _ALIASES.values() for alias in aliases)
+        extra = {
+            key: [r.get(key) for r in records] for key in keys if key not in typed
+        }
+        return cls(keys, numeric, codes, categories, extra, integral)
+
+    def __len__(self) -> int:
+        return len(self.hashrate)
+
+    def has_column(self, key: str) -> bool:
+        aliases = next((a for a in _ALIASES.values() if key in a), (key,))
+        return any(alias in self.keys for alias in aliases)
+
+    def column(self, key: str, indices: Optional[np.ndarray] = None) -> List[Any]:
+        """Return one column as a list of Python values, in the original key spelling."""
+        if indices is None:
+            indices = np.arange(len(self))
+        for name, (column, _) in _NUMERIC.items():
+            if key in _ALIASES.get(column, (column,)):
+                values = getattr(self, name)[indices]
+                if self._integral.get(name) and values.dtype.kind == "f":
+                    values = values.astype(np.int64)
+                return values.tolist()
+        for name, column in _CATEGORICAL.items():
+            if key == column:
+                labels = getattr(self, name + "s")
+                return [labels[c] for c in getattr(self, name + "_codes")[indices]]
+        values = self._extra[key]
+        return [values[i] for i in indices]
+
+    def records(self, indices: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
+        """Rebuild the list-of-dicts view, optionally for a subset of rows."""
+        columns = [self.column(key, indices) for key in self.keys]
+        return [dict(zip(self.keys, row)) for row in zip(*columns)]
+
+    def code_of(self, name: str, label: Any) -> int:
+        """Categorical code for a model/location/user label, or -1 if unknown."""
+        labels = getattr(self, name + "s")
+        try:
+            return labels.index(label)
+        except ValueError:
+            return -1
+
+    def filter(
+        self,
+        model: Optional[str] = None,
+        location: Optional[str] = None,
+        min_hashrate: Optional[float] = None,
+        max_daily_price: Optional[float] = None,
+        in_stock: bool = True,
+    ) -> np.ndarray:
+        """Return the row indices matching all of the given conditions."""
+        mask = np.ones(len(self), dtype=bool)
+        if model is not None:
+            mask &= self.model_codes == self.code_of("model", model)
+        if location is not None:
+            mask &= self.location_codes == self.code_of("location", location)
+        if min_hashrate is not None:
+            mask &= self.hashrate >= min_hashrate
+        if max_daily_price is not None:
+            mask &= self.daily_price <= max_daily_price
+        if in_stock:
+            mask &= self.quantity > 0
+        return np.flatnonzero(mask)
+
+    def _per_th(self, name: str, values: np.ndarray) -> np.ndarray:
+        # The inventory is immutable, so each metric is computed once and shared
+        metric = self._metrics.get(name)
+        if metric is None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                metric = np.where(self.hashrate > 0, values / self.hashrate, np.inf)
+            metric.setflags(write=False)
+            self._metrics[name] = metric
+        return metric
+
+    def cost_per_th(self) -> np.ndarray:
+        """Daily rental price per TH/s for every listing."""
+        return self._per_th("cost_per_th", self.daily_price)
+
+    def joules_per_th(self) -> np.ndarray:
+        """Energy efficiency (W per TH/s, i.e. J/TH) for every listing."""
+        return self._per_th("joules_per_th", self.power)
@@ -0,0 +1,111 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+
+Stamp = Tuple[int, int, int]
+
+
+class Snapshot(NamedTuple):
+    """An immutable view of one version of a JSON data file."""
+
+    records: List[Dict[str, Any]]
+    index: Any
+    version: Stamp
+    loaded_at: float
+
+
+def file_stamp(path: str) -> Stamp:
+    """(mtime_ns, size, inode) - changes whenever the file is rewritten or replaced."""
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class SnapshotLoader:
+    """
+    Loads a JSON array once and revalidates it by mtime/size on every access.
+
+    When the file changes, the current snapshot keeps being served while a
+    background thread parses the new file and rebuilds the derived index; the new
+    snapshot is then published with a single reference assignment. Readers take
+    one snapshot per call and never see a half-loaded state or wait on a reparse
+    (only the very first load is synchronous).
+
+    `build(records, previous)` returns the derived index for a snapshot; `previous`
+    is the snapshot being replaced (None on first load) so indexes can be updated
+    incrementally.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        build: Optional[Callable[[List[Dict[str, Any]], Optional[Snapshot]], Any]] = None,
+    ):
+        self.path = path
+        self._build = build or (lambda records, previous: None)
+        self._snapshot: Optional[Snapshot] = None
+        self._lock = threading.Lock()
+        # Separate from _lock so scheduling never waits behind a parse in progress
+        self._schedule_lock = threading.Lock()
+        self._reloading = False
+        self._failed: Optional[Stamp] = None
+        self.reloads = 0
+        self.last_error: Optional[str] = None
+
+    def get(self) -> Snapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                if self._snapshot is None:
+                    self._load(file_stamp(self.path))
+                return self._snapshot
+
+        try:
+            stamp = file_stamp(self.path)
+        except OSError:
+            # Keep serving the last good snapshot if the file is briefly missing
+            return snapshot
+        if stamp != snapshot.version and stamp != self._failed:
+            self._schedule(stamp)
+        return snapshot
+
+    @property
+    def version(self) -> Stamp:
+        return self.get().version
+
+    def reload(self) -> Snapshot:
+        """Synchronously load the current file contents (used for warm-up)."""
+        with self._lock:
+            self._load(file_stamp(self.path))
+            return self._snapshot
+
+    def _schedule(self, stamp: Stamp) -> None:
+        with self._schedule_lock:
+            if self._reloading:
+                return
+            self._reloading = True
+        threading.Thread(target=self._reload, args=(stamp,), daemon=True).start()
+
+    def _reload(self, stamp: Stamp) -> None:
+        try:
+            with self._lock:
+                self._load(stamp)
+        except Exception as e:
+            # A writer may still be mid-file; retry once the stamp moves again
+            self._failed = stamp
+            self.last_error = str(e)
+            print(f"Error reloading {self.path}: {e}")
+        finally:
+            self._reloading = False
+
+    def _load(self, stamp: Stamp) -> None:
+        with open(self.path, "r") as f:
+            records = json.load(f)
+        index = self._build(records, self._snapshot)
+        # Publishing is a single reference swap, so readers see old or new, never both
+        self._snapshot = Snapshot(records, index, stamp, time.time())
+        self._failed = None
+        self.last_error = None
+        self.reloads += 1
@@ -0,0 +1,165 @@
+import math
+from typing import Any, Dict, List
+
+import numpy as np
+
+from tools.inventory import AsicInventory
+
+
+def _split(quantity: int) -> List[int]:
+    """Binary split of a bounded quantity into 0/1 chunks (1, 2, 4, ..., rest)."""
+    chunks, size = [], 1
+    while quantity > 0:
+        take = min(size, quantity)
+        chunks.append(take)
+        quantity -= take
+        size *= 2
+    return chunks
+
+
+def _cover_dp(hashrate: np.ndarray, price: np.ndarray, quantity: np.ndarray, target: int):
+    """
+    Bounded min-cost cover: choose unit counts so that sum(hashrate * units) >= target
+    at the lowest total price. States above the target are folded into the target
+    state, so the table only has target + 1 cells.
+    """
+    chunk_item, chunk_units = [], []
+    for i, q in enumerate(quantity.tolist()):
+        for units in _split(int(q)):
+            chunk_item.append(i)
+            chunk_units.append(units)
+
+    dp = np.full(target + 1, np.inf)
+    dp[0] = 0.0
+    take = np.zeros((len(chunk_item), target + 1), dtype=bool)
+    cap_parent = np.full(len(chunk_item), -1, dtype=np.int64)
+
+    for j, (i, units) in enumerate(zip(chunk_item, chunk_units)):
+        h = int(hashrate[i]) * units
+        if h <= 0:
+            continue
+        c = float(price[i]) * units
+        new = dp.copy()
+        if h <= target:
+            cand = dp[: target + 1 - h] + c
+            better = cand < new[h:]
+            new[h:][better] = cand[better]
+            take[j, h:] = better
+        # Any state within h of the target overshoots into the target state
+        lo = max(0, target - h)
+        s = lo + int(np.argmin(dp[lo:]))
+        if dp[s] + c < new[target]:
+            new[target] = dp[s] + c
+            take[j, target] = True
+            cap_parent[j] = s
+        dp = new
+
+    if not np.isfinite(dp[target]):
+        return None
+
+    units_out = np.zeros(len(hashrate), dtype=np.int64)
+    state = target
+    for j in range(len(chunk_item) - 1, -1, -1):
+        if not take[j, state]:
+            continue
+        i, units = chunk_item[j], chunk_units[j]
+        units_out[i] += units
+        if state == target and cap_parent[j] >= 0:
+            state = int(cap_parent[j])
+        else:
+            state -= int(hashrate[i]) * units
+    return units_out
+
+
+def fulfill_hashrate(
+    inventory: AsicInventory,
+    target_hashrate: float,
+    budget: float,
+    runtime_days: int,
+    max_candidates: int = 96,
+    resolution: int = 20000,
+) -> Dict[str, Any]:
+    """
+    Pick the cheapest mix of listings and unit counts that reaches target_hashrate.
+
+    Listings are ordered by cost per TH/s. The cheapest part of that order that is
+    certainly needed is taken in full, and the remainder of the target is solved
+    exactly as a bounded knapsack over the next max_candidates listings. Hashrate is
+    discretized to at most `resolution` cells, rounding listing hashrate down so the
+    returned mix always reaches the target.
+    """
+    idx = inventory.filter(max_daily_price=budget)
+    idx = idx[inventory.hashrate[idx] > 0]
+    order = idx[np.lexsort((inventory.daily_price[idx], inventory.cost_per_th()[idx]))]
+
+    hashrate = inventory.hashrate[order]
+    price = inventory.daily_price[order]
+    quantity = inventory.quantity[order]
+    cumulative = np.cumsum(hashrate * quantity)
+
+    available = float(cumulative[-1]) if len(cumulative) else 0.0
+    if target_hashrate <= 0 or available < target_hashrate:
+        return {
+            "feasible": False,
+            "reason": "Not enough hashrate available within the daily budget",
+            "available_hashrate_TH": available,
+        }
+
+    # Fractional (LP) lower bound from the cost-per-TH ordering
+    k = int(np.searchsorted(cumulative, target_hashrate))
+    before = float(cumulative[k - 1]) if k else 0.0
+    lower_bound = float(np.sum(price[:k] * quantity[:k])) + (
+        target_hashrate - before
+    ) / hashrate[k] * price[k]
+
+    # Commit the head of the order greedily and optimize the tail exactly
+    fixed = max(0, k + 1 - max_candidates // 2)
+    units = np.zeros(len(order), dtype=np.int64)
+    units[:fixed] = quantity[:fixed]
+    residual = target_hashrate - (float(cumulative[fixed - 1]) if fixed else 0.0)
+
+    pool = slice(fixed, fixed + max_candidates)
+    scale = max(1.0, residual / resolution)
+    cells = int(math.ceil(residual / scale))
+    pool_units = _cover_dp(
+        np.floor(hashrate[pool] / scale), price[pool], quantity[pool], cells
+    )
+    if pool_units is None:
+        # Rounding lost too much hashrate; fall back to whole units in order
+        pool_units = np.zeros(len(hashrate[pool]), dtype=np.int64)
+        remaining = residual
+        for j, (h, q) in enumerate(zip(hashrate[pool], quantity[pool])):
+            if remaining <= 0:
+                break
+            pool_units[j] = min(int(q), int(math.ceil(remaining / h)))
+            remaining -= pool_units[j] * h
+    units[pool] = pool_units
+
+    chosen = np.flatnonzero(units)
+    rows = order[chosen]
+    daily_cost = float(np.sum(units[chosen] * price[chosen]))
+    total_hashrate = float(np.sum(units[chosen] * hashrate[chosen]))
+
+    allocation = [
+        {
+            "seller": inventory.users[inventory.user_codes[i]],
+            "model": inventory.models[inventory.model_codes[i]],
+            "location": inventory.locations[inventory.location_codes[i]],
+            "units": int(n),
+            "hashrate_TH": float(n * inventory.hashrate[i]),
+            "daily_cost": round(float(n * inventory.daily_price[i]), 2),
+        }
+        for i, n in zip(rows, units[chosen])
+    ]
+
+    result = {
+        "feasible": daily_cost <= budget,
+        "allocation": allocation,
+        "total_hashrate_TH": total_hashrate,
+        "daily_cost": round(daily_cost, 2),
+        "runtime_cost": round(daily_cost * runtime_days, 2),
+        "lower_bound_daily_cost": round(float(lower_bound), 2),
+    }
+    if daily_cost > budget:
+        result["reason"] = "The cheapest mix that reaches the target exceeds the daily budget"
+    return result
@@ -0,0 +1,86 @@
+import os
+from typing import Any, Dict, List
+
+import numpy as np
+
+from tools.inventory import AsicInventory
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Network assumptions used for the profit estimate. They can be overridden from
+# the environment so the numbers track the current hashprice.
+BTC_PER_TH_PER_DAY = float(os.getenv("BTC_PER_TH_PER_DAY", "0.0000005"))
+BTC_PRICE_USD = float(os.getenv("BTC_PRICE_USD", "100000"))
+# The listed rental price is all-in by default; set this to charge power on top
+ELECTRICITY_USD_PER_KWH = float(os.getenv("ELECTRICITY_USD_PER_KWH", "0"))
+
+
+def rank_listings(
+    inventory: AsicInventory,
+    budget: float,
+    target_hashrate: float,
+    runtime_days: int,
+    top_k: int = 3,
+    distinct_models: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Score every listing in one vectorized pass and return the best top_k.
+
+    Each listing is sized to the number of units needed to reach the target
+    hashrate, capped by stock and by the daily budget. Listings that reach the
+    target come first, then the order is cost per TH/s and joules per TH; with
+    distinct_models only the best listing of each model is kept.
+    """
+    hashrate = inventory.hashrate
+    price = inventory.daily_price
+    cost_per_th = inventory.cost_per_th()
+    joules_per_th = inventory.joules_per_th()
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        needed = np.where(hashrate > 0, np.ceil(target_hashrate / hashrate), 0)
+        affordable = np.where(price > 0, np.floor(budget / price), inventory.quantity)
+    units = np.minimum(np.minimum(needed, affordable), inventory.quantity)
+    units = np.maximum(units, 0).astype(np.int64)
+
+    total_hashrate = units * hashrate
+    daily_cost = units * price
+    power_cost = units * inventory.power / 1000 * 24 * ELECTRICITY_USD_PER_KWH
+    revenue_btc = total_hashrate * BTC_PER_TH_PER_DAY
+    profit_usd = revenue_btc * BTC_PRICE_USD - daily_cost - power_cost
+
+    candidates = np.flatnonzero(units > 0)
+    short = total_hashrate[candidates] < target_hashrate
+    # lexsort uses the last key as the primary one
+    order = candidates[
+        np.lexsort((joules_per_th[candidates], cost_per_th[candidates], short))
+    ]
+    if distinct_models:
+        _, first = np.unique(inventory.model_codes[order], return_index=True)
+        order = order[np.sort(first)]
+    top = order[:top_k]
+
+    results = []
+    for rank, i in enumerate(top, start=1):
+        results.append(
+            {
+                "rank": rank,
+                "model": inventory.models[inventory.model_codes[i]],
+                "seller": inventory.users[inventory.user_codes[i]],
+                "location": inventory.locations[inventory.location_codes[i]],
+                "units": int(units[i]),
+                "total_hashrate_TH": float(total_hashrate[i]),
+                "meets_target": bool(total_hashrate[i] >= target_hashrate),
+                "daily_cost": round(float(daily_cost[i]), 2),
+                "runtime_cost": round(float(daily_cost[i] * runtime_days), 2),
+                "cost_per_TH": round(float(cost_per_th[i]), 4),
+                "joules_per_TH": round(float(joules_per_th[i]), 2),
+                "estimated_daily_profit_btc": round(
+                    float(revenue_btc[i] - (daily_cost[i] + power_cost[i]) / BTC_PRICE_USD),
+                    8,
+                ),
+                "estimated_daily_profit_usd": round(float(profit_usd[i]), 2),
+            }
+        )
+    return results
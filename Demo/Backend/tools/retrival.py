@@ -1,30 +1,68 @@
 import sys 
 import os
-from typing import Dict
+from typing import Any, Dict, Optional
 
 from dotenv import load_dotenv
 load_dotenv()
 
 sys.path.append(os.path.abspath(os.path.join(os.getcwd(), '..')))
 
-from CockroachDB.cockroachDB import CockroachDBAgent
+from CockroachDB.backend import open_agent, open_async_agent
+
+# Upper bound on rows handed to the model in one call
+MAX_PAGE_SIZE = 200
+
+
+def next_id(after_id):
+    # As a string: the model passes it back as after_id, and INT8 ids above
+    # 2**53 would lose precision as JSON numbers
+    return None if after_id is None else str(after_id)
 
 
 class retrive: 
     def __init__(self, connection_string): 
         self.connection_string = connection_string
-        self.db = CockroachDBAgent(self.connection_string)
+        self.db = open_agent(self.connection_string)
+        self._adb = None
+
+    # Async agent for the coroutine tools, created on first use
+    @property
+    def adb(self):
+        if self._adb is None:
+            self._adb = open_async_agent(self.connection_string)
+        return self._adb
+
+    def retrive(self, after_id: Optional[str] = None, limit: int = 50) -> Dict[str, Any]:
+        """
+        Retrieve one page of candidate data from the database, ordered by id.
+        Pass the returned "Next After ID" as after_id to get the next page; it is
+        null when there are no more candidates.
+        """
+        try:
+            limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+            retrived_data, next_after_id = self.db.get_candidates_page(after_id, limit)
+        except Exception as e:
+            return {"error": str(e)}
+        return {
+            "Retrived Data" : retrived_data,
+            "Next After ID": next_id(next_after_id),
+        }
 
-    def retrive(self) -> Dict[str, str]:
+    # Coroutine version for async graph execution: the DB wait does not hold a thread
+    async def aretrive(self, after_id: Optional[str] = None, limit: int = 50) -> Dict[str, Any]:
         """
-        Retrieve the candidate data from the database based on the description.
+        Retrieve one page of candidate data from the database, ordered by id.
+        Pass the returned "Next After ID" as after_id to get the next page; it is
+        null when there are no more candidates.
         """
-        # Placeholder for actual database retrieval logic
-        # In a real implementation, this would query the database and return the result
-        self.db.connect()
-        retrived_data = self.db.get_candidates()
+        try:
+            limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+            retrived_data, next_after_id = await self.adb.get_candidates_page(after_id, limit)
+        except Exception as e:
+            return {"error": str(e)}
         return {
-            "Retrived Data" : retrived_data
+            "Retrived Data" : retrived_data,
+            "Next After ID": next_id(next_after_id),
         }
     
 if __name__ == "__main__":
@@ -35,8 +35,17 @@ class tools:
 
         self.sell = self.seller_tool.retrieve
         self.rent = self.renter_tool.retrieve
-
-        self.tools_list = [self.sell, self.rent]
+        self.rank = self.seller_tool.rank_asics
+        self.fulfill = self.seller_tool.fulfill_hashrate
+        self.summarize = self.seller_tool.summarize_models
+
+        self.tools_list = [
+            self.sell,
+            self.rent,
+            self.rank,
+            self.fulfill,
+            self.summarize,
+        ]
 
     def toolkit(self):
         return self.tools_list
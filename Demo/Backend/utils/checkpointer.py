@@ -0,0 +1,525 @@
+import asyncio
+import random
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+    writes_sort_key,
+)
+
+# Serialized values at least this large are zlib-compressed before storing
+COMPRESS_MIN_BYTES = 256
+# Minimum seconds between TTL/size sweeps (each process sweeps on its own)
+SWEEP_INTERVAL = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    thread_id TEXT PRIMARY KEY,
+    last_access REAL NOT NULL,
+    bytes INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS sessions_last_access ON sessions (last_access);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    parent_id TEXT,
+    type TEXT NOT NULL,
+    checkpoint BLOB NOT NULL,
+    metadata_type TEXT NOT NULL,
+    metadata BLOB NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    version TEXT NOT NULL,
+    type TEXT NOT NULL,
+    data BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    type TEXT NOT NULL,
+    data BLOB,
+    task_path TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+"""
+
+
+class SQLiteCheckpointer(BaseCheckpointSaver[str]):
+    """
+    LangGraph checkpointer backed by a local SQLite file.
+
+    Replaces MemorySaver so conversation state survives restarts and stays out
+    of process memory. The database runs in WAL mode, so several worker
+    processes on one host can share sessions. Storage is bounded three ways:
+    only the newest `keep_checkpoints` checkpoints of a thread are kept, sessions
+    idle for longer than `ttl` seconds expire, and when the file holds more than
+    `max_bytes` of session data the least recently used sessions are evicted.
+    Values are stored with the graph's serializer and zlib-compressed when large.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: Optional[float] = 86400.0,
+        max_bytes: Optional[int] = 256 * 1024 * 1024,
+        keep_checkpoints: Optional[int] = 2,
+        serde=None,
+    ):
+        super().__init__(serde=serde)
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.keep_checkpoints = keep_checkpoints
+        self._local = threading.local()
+        self._sweep_lock = threading.Lock()
+        self._last_sweep = 0.0
+
+        self.expired = 0
+        self.evicted = 0
+
+        self._conn().executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        # sqlite3 connections are not safe to share, so each thread gets its own
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self._conn()
+        # IMMEDIATE takes the write lock up front, so concurrent writers (other
+        # threads or processes) queue on the busy timeout instead of failing
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _dump(self, value: Any) -> Tuple[str, bytes]:
+        type_, data = self.serde.dumps_typed(value)
+        if len(data) >= COMPRESS_MIN_BYTES:
+            return "zlib:" + type_, zlib.compress(data)
+        return type_, data
+
+    def _load(self, type_: str, data: bytes) -> Any:
+        if type_.startswith("zlib:"):
+            type_, data = type_[5:], zlib.decompress(data)
+        return self.serde.loads_typed((type_, data))
+
+    def _touch(self, conn: sqlite3.Connection, thread_id: str) -> None:
+        # Refresh at most once a second so reads rarely need the write lock
+        now = time.time()
+        conn.execute(
+            "UPDATE sessions SET last_access = ? WHERE thread_id = ? AND last_access < ?",
+            (now, thread_id, now - 1),
+        )
+
+    def _tuple(self, conn: sqlite3.Connection, row: sqlite3.Row) -> CheckpointTuple:
+        thread_id, checkpoint_ns, checkpoint_id, parent_id, type_, data, meta_type, meta = row
+        checkpoint = self._load(type_, data)
+
+        channel_values = {}
+        for channel, version in checkpoint["channel_versions"].items():
+            blob = conn.execute(
+                "SELECT type, data FROM blobs WHERE thread_id = ? AND checkpoint_ns = ? "
+                "AND channel = ? AND version = ?",
+                (thread_id, checkpoint_ns, channel, str(version)),
+            ).fetchone()
+            if blob and blob[0] != "empty":
+                channel_values[channel] = self._load(*blob)
+
+        writes = conn.execute(
+            "SELECT task_id, idx, channel, type, data, task_path FROM writes "
+            "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+        writes.sort(key=lambda w: writes_sort_key(w[5], w[0], w[1]))
+
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint={**checkpoint, "channel_values": channel_values},
+            metadata=self._load(meta_type, meta),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_id,
+                    }
+                }
+                if parent_id
+                else None
+            ),
+            pending_writes=[
+                (task_id, channel, self._load(type_, data))
+                for task_id, _, channel, type_, data, _ in writes
+            ],
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = get_checkpoint_id(config)
+        conn = self._conn()
+        query = (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_id, type, checkpoint, "
+            "metadata_type, metadata FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?"
+        )
+        if checkpoint_id:
+            row = conn.execute(
+                query + " AND checkpoint_id = ?", (thread_id, checkpoint_ns, checkpoint_id)
+            ).fetchone()
+        else:
+            row = conn.execute(
+                query + " ORDER BY checkpoint_id DESC LIMIT 1", (thread_id, checkpoint_ns)
+            ).fetchone()
+        if row is None:
+            return None
+        self._touch(conn, thread_id)
+        return self._tuple(conn, row)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        clauses, params = [], []
+        if config:
+            clauses.append("thread_id = ?")
+            params.append(config["configurable"]["thread_id"])
+            checkpoint_ns = config["configurable"].get("checkpoint_ns")
+            if checkpoint_ns is not None:
+                clauses.append("checkpoint_ns = ?")
+                params.append(checkpoint_ns)
+            if get_checkpoint_id(config):
+                clauses.append("checkpoint_id = ?")
+                params.append(get_checkpoint_id(config))
+        if before and get_checkpoint_id(before):
+            clauses.append("checkpoint_id < ?")
+            params.append(get_checkpoint_id(before))
+
+        query = (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_id, type, checkpoint, "
+            "metadata_type, metadata FROM checkpoints"
+        )
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY thread_id, checkpoint_ns, checkpoint_id DESC"
+
+        conn = self._conn()
+        for row in conn.execute(query, params).fetchall():
+            if limit is not None and limit <= 0:
+                break
+            if filter:
+                metadata = self._load(row[6], row[7])
+                if not all(metadata.get(k) == v for k, v in filter.items()):
+                    continue
+            if limit is not None:
+                limit -= 1
+            yield self._tuple(conn, row)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        stored = checkpoint.copy()
+        values = stored.pop("channel_values")
+
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO blobs VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (thread_id, checkpoint_ns, channel, str(version))
+                    + (self._dump(values[channel]) if channel in values else ("empty", None))
+                    for channel, version in new_versions.items()
+                ],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    config["configurable"].get("checkpoint_id"),
+                    *self._dump(stored),
+                    *self._dump(get_checkpoint_metadata(config, metadata)),
+                ),
+            )
+            if self.keep_checkpoints:
+                self._prune(conn, thread_id, checkpoint_ns)
+            self._account(conn, thread_id)
+
+        self._maybe_sweep(thread_id)
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        rows = [
+            (thread_id, checkpoint_ns, checkpoint_id, task_id, WRITES_IDX_MAP.get(channel, idx), channel)
+            + self._dump(value)
+            + (task_path,)
+            for idx, (channel, value) in enumerate(writes)
+        ]
+        with self._transaction() as conn:
+            # Regular writes are idempotent per (task, idx); special ones overwrite
+            for row in rows:
+                verb = "INSERT OR REPLACE" if row[4] < 0 else "INSERT OR IGNORE"
+                conn.execute(f"{verb} INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+            self._account(conn, thread_id)
+
+    def _prune(self, conn: sqlite3.Connection, thread_id: str, checkpoint_ns: str) -> None:
+        """Drop all but the newest checkpoints of a thread, with their writes and blobs."""
+        old = [
+            row[0]
+            for row in conn.execute(
+                "SELECT checkpoint_id FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? "
+                "ORDER BY checkpoint_id DESC LIMIT -1 OFFSET ?",
+                (thread_id, checkpoint_ns, self.keep_checkpoints),
+            )
+        ]
+        if not old:
+            return
+        for table in ("checkpoints", "writes"):
+            conn.executemany(
+                f"DELETE FROM {table} WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                [(thread_id, checkpoint_ns, checkpoint_id) for checkpoint_id in old],
+            )
+
+        # Blobs stay only while a remaining checkpoint still points at their version
+        referenced = set()
+        for type_, data in conn.execute(
+            "SELECT type, checkpoint FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?",
+            (thread_id, checkpoint_ns),
+        ):
+            for channel, version in self._load(type_, data)["channel_versions"].items():
+                referenced.add((channel, str(version)))
+        stale = [
+            (thread_id, checkpoint_ns, channel, version)
+            for channel, version in conn.execute(
+                "SELECT channel, version FROM blobs WHERE thread_id = ? AND checkpoint_ns = ?",
+                (thread_id, checkpoint_ns),
+            )
+            if (channel, version) not in referenced
+        ]
+        conn.executemany(
+            "DELETE FROM blobs WHERE thread_id = ? AND checkpoint_ns = ? AND channel = ? AND version = ?",
+            stale,
+        )
+
+    def _account(self, conn: sqlite3.Connection, thread_id: str) -> None:
+        """Record the thread's stored size and mark it as just used."""
+        size = conn.execute(
+            "SELECT "
+            "(SELECT IFNULL(SUM(LENGTH(checkpoint) + LENGTH(metadata)), 0) FROM checkpoints WHERE thread_id = ?) + "
+            "(SELECT IFNULL(SUM(LENGTH(data)), 0) FROM blobs WHERE thread_id = ?) + "
+            "(SELECT IFNULL(SUM(LENGTH(data)), 0) FROM writes WHERE thread_id = ?)",
+            (thread_id, thread_id, thread_id),
+        ).fetchone()[0]
+        conn.execute(
+            "INSERT INTO sessions (thread_id, last_access, bytes) VALUES (?, ?, ?) "
+            "ON CONFLICT (thread_id) DO UPDATE SET last_access = excluded.last_access, bytes = excluded.bytes",
+            (thread_id, time.time(), size),
+        )
+
+    def _delete(self, conn: sqlite3.Connection, thread_ids: Sequence[str]) -> None:
+        params = [(thread_id,) for thread_id in thread_ids]
+        for table in ("checkpoints", "blobs", "writes", "sessions"):
+            conn.executemany(f"DELETE FROM {table} WHERE thread_id = ?", params)
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._transaction() as conn:
+            self._delete(conn, [thread_id])
+
+    def delete_threads(self, thread_ids: Sequence[str]) -> int:
+        """Delete many sessions in one transaction; returns how many existed."""
+        with self._transaction() as conn:
+            existing = self._existing(conn, thread_ids)
+            self._delete(conn, existing)
+        return len(existing)
+
+    def expire_idle(self, idle_seconds: float) -> int:
+        """Delete every session not used in the last `idle_seconds`, in one transaction."""
+        with self._transaction() as conn:
+            expired = self._idle(conn, time.time() - idle_seconds)
+            self._delete(conn, expired)
+        self.expired += len(expired)
+        return len(expired)
+
+    def _existing(self, conn: sqlite3.Connection, thread_ids: Sequence[str]) -> List[str]:
+        return [
+            thread_id
+            for thread_id in dict.fromkeys(thread_ids)
+            if conn.execute(
+                "SELECT 1 FROM sessions WHERE thread_id = ?", (thread_id,)
+            ).fetchone()
+        ]
+
+    def _idle(self, conn: sqlite3.Connection, cutoff: float, current: Optional[str] = None) -> List[str]:
+        return [
+            row[0]
+            for row in conn.execute("SELECT thread_id FROM sessions WHERE last_access < ?", (cutoff,))
+            if row[0] != current
+        ]
+
+    def _maybe_sweep(self, current: Optional[str] = None) -> None:
+        now = time.monotonic()
+        if now - self._last_sweep < SWEEP_INTERVAL or not self._sweep_lock.acquire(False):
+            return
+        try:
+            self._last_sweep = now
+            self.sweep(current)
+        finally:
+            self._sweep_lock.release()
+
+    def sweep(self, current: Optional[str] = None) -> Dict[str, int]:
+        """
+        Expire sessions idle past the TTL, then evict least recently used sessions
+        until the stored total is under max_bytes. `current` is never evicted.
+        """
+        expired, evicted = [], []
+        with self._transaction() as conn:
+            if self.ttl:
+                expired = self._idle(conn, time.time() - self.ttl, current)
+                self._delete(conn, expired)
+
+            if self.max_bytes:
+                total = conn.execute("SELECT IFNULL(SUM(bytes), 0) FROM sessions").fetchone()[0]
+                if total > self.max_bytes:
+                    for thread_id, size in conn.execute(
+                        "SELECT thread_id, bytes FROM sessions ORDER BY last_access"
+                    ).fetchall():
+                        if total <= self.max_bytes:
+                            break
+                        if thread_id == current:
+                            continue
+                        evicted.append(thread_id)
+                        total -= size
+                    self._delete(conn, evicted)
+
+        self.expired += len(expired)
+        self.evicted += len(evicted)
+        return {"expired": len(expired), "evicted": len(evicted)}
+
+    def stats(self) -> Dict[str, Any]:
+        sessions, total = self._conn().execute(
+            "SELECT COUNT(*), IFNULL(SUM(bytes), 0) FROM sessions"
+        ).fetchone()
+        return {
+            "path": self.path,
+            "sessions": sessions,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl,
+            "expired": self.expired,
+            "evicted": self.evicted,
+        }
+
+    def get_next_version(self, current: Optional[str], channel: None = None) -> str:
+        # Same string versions as MemorySaver: a zero-padded counter plus a random
+        # suffix, so versions written by different processes never collide
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    # SQLite calls are short, so the async methods run them on a worker thread
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        items: List[CheckpointTuple] = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        return await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        return await asyncio.to_thread(self.delete_thread, thread_id)
+
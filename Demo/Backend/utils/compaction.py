@@ -0,0 +1,138 @@
+import threading
+from collections import deque
+from typing import Any, Dict, List, Sequence
+
+from langchain_core.messages import BaseMessage, HumanMessage, RemoveMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig
+
+from utils.rate_limiter import estimate_tokens
+from utils.utils import AgentState
+
+# Marks a ToolMessage whose content has already been replaced by a handle
+COMPACTED = "compacted"
+
+
+def turn_starts(messages: Sequence[BaseMessage]) -> List[int]:
+    """Index of every HumanMessage; each one opens a new turn."""
+    return [i for i, m in enumerate(messages) if isinstance(m, HumanMessage)]
+
+
+class Compactor:
+    """
+    Graph node that keeps the conversation sent to the model small.
+
+    It runs before every agent call. The last `keep_turns` turns stay verbatim;
+    in older turns every ToolMessage (the large inventory/ranking dumps) is
+    replaced, under the same message id, by a short handle naming the tool, its
+    original size and a preview. If the history is still over `max_tokens`
+    (after `reserved_tokens` for the system prompt), whole turns are dropped
+    from the oldest end, so a tool result is never left without the AI message
+    that called it. Every call records the prompt size before and after.
+    """
+
+    def __init__(
+        self,
+        keep_turns: int = 2,
+        max_tokens: int = 8000,
+        reserved_tokens: int = 0,
+        preview_chars: int = 160,
+        history: int = 1000,
+    ):
+        self.keep_turns = max(1, keep_turns)
+        self.max_tokens = max_tokens
+        self.reserved_tokens = reserved_tokens
+        self.preview_chars = preview_chars
+        self._records = deque(maxlen=history)
+        self._lock = threading.Lock()
+
+        self.turns = 0
+        self.elided = 0
+        self.dropped = 0
+
+    def handle(self, message: ToolMessage) -> ToolMessage:
+        content = str(message.content)
+        preview = " ".join(content[: self.preview_chars].split())
+        return ToolMessage(
+            id=message.id,
+            tool_call_id=message.tool_call_id,
+            name=message.name,
+            content=(
+                f"[{message.name or 'tool'} result from an earlier turn, "
+                f"{len(content)} chars elided] {preview}..."
+            ),
+            additional_kwargs={COMPACTED: True},
+        )
+
+    def compact(self, messages: Sequence[BaseMessage]) -> Dict[str, Any]:
+        """Work out the updates for one history; returns updates, kept messages and counts."""
+        starts = turn_starts(messages)
+        verbatim_from = starts[-self.keep_turns] if len(starts) >= self.keep_turns else 0
+
+        kept = list(messages)
+        updates: List[BaseMessage] = []
+        elided = 0
+        for i in range(verbatim_from):
+            message = kept[i]
+            if isinstance(message, ToolMessage) and not message.additional_kwargs.get(COMPACTED):
+                kept[i] = self.handle(message)
+                updates.append(kept[i])
+                elided += 1
+
+        # Over budget: drop whole turns from the front, never the current one.
+        # Messages before the first HumanMessage belong to no turn and go first.
+        budget = self.max_tokens - self.reserved_tokens
+        dropped = 0
+        while estimate_tokens(kept) > budget:
+            starts = turn_starts(kept)
+            end = starts[0] if starts and starts[0] > 0 else (starts[1] if len(starts) > 1 else 0)
+            if end == 0:
+                break
+            updates.extend(RemoveMessage(id=message.id) for message in kept[:end])
+            dropped += end
+            kept = kept[end:]
+
+        # A message that is replaced and then removed only needs the removal
+        removed = {u.id for u in updates if isinstance(u, RemoveMessage)}
+        updates = [u for u in updates if isinstance(u, RemoveMessage) or u.id not in removed]
+        return {"updates": updates, "kept": kept, "elided": elided, "dropped": dropped}
+
+    def __call__(self, state: AgentState, config: RunnableConfig) -> dict:
+        messages = state["messages"]
+        result = self.compact(messages)
+
+        record = {
+            "thread_id": (config or {}).get("configurable", {}).get("thread_id"),
+            "messages_before": len(messages),
+            "messages_after": len(result["kept"]),
+            "tokens_before": estimate_tokens(messages) + self.reserved_tokens,
+            "tokens_after": estimate_tokens(result["kept"]) + self.reserved_tokens,
+            "elided": result["elided"],
+            "dropped": result["dropped"],
+        }
+        with self._lock:
+            self._records.append(record)
+            self.turns += 1
+            self.elided += result["elided"]
+            self.dropped += result["dropped"]
+
+        return {"messages": result["updates"]}
+
+    def stats(self, recent: int = 20) -> Dict[str, Any]:
+        with self._lock:
+            records = list(self._records)
+            totals = {
+                "calls": self.turns,
+                "elided_tool_messages": self.elided,
+                "dropped_messages": self.dropped,
+            }
+        after = [r["tokens_after"] for r in records]
+        before = [r["tokens_before"] for r in records]
+        return {
+            **totals,
+            "keep_turns": self.keep_turns,
+            "max_tokens": self.max_tokens,
+            "avg_prompt_tokens_before": round(sum(before) / len(before), 1) if before else 0.0,
+            "avg_prompt_tokens_after": round(sum(after) / len(after), 1) if after else 0.0,
+            "max_prompt_tokens_after": max(after, default=0),
+            "recent": records[-recent:],
+        }
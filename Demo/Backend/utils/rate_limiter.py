@@ -0,0 +1,196 @@
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Sequence
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# The adaptive rate never drops below this fraction of the configured limits
+MIN_SCALE = 0.05
+# How often a queued coroutine checks whether it is at the head of the line
+ASYNC_POLL_SECONDS = 0.01
+
+
+def estimate_tokens(messages: Sequence[Any]) -> int:
+    """Rough prompt size: about four characters per token plus a little per message."""
+    chars = sum(len(str(getattr(m, "content", m))) for m in messages)
+    return chars // 4 + 4 * len(messages)
+
+
+def retry_after(error: Exception) -> Optional[float]:
+    """Seconds from a 429's Retry-After header, when the error carries a response."""
+    response = getattr(error, "response", None)
+    value = getattr(response, "headers", {}).get("retry-after") if response else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def is_rate_limited(error: Exception) -> bool:
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        return True
+    return "429" in str(error) or "rate limit" in str(error).lower()
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket for requests per second and tokens per minute.
+
+    Callers are served in arrival order (ticket based), so a burst of requests is
+    queued fairly rather than racing. When there is headroom acquire() returns
+    immediately. backoff() halves the effective rate and pauses callers after a
+    429; every success() recovers part of the rate again.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float,
+        tokens_per_minute: float,
+        burst: Optional[float] = None,
+    ):
+        self.requests_per_second = requests_per_second
+        self.tokens_per_minute = tokens_per_minute
+        self._burst = burst or max(1.0, requests_per_second)
+        self._requests = self._burst
+        self._tokens = float(tokens_per_minute)
+        self._scale = 1.0
+        self._blocked_until = 0.0
+        self._updated = time.monotonic()
+        self._cond = threading.Condition()
+        self._next_ticket = 0
+        self._now_serving = 0
+        self._abandoned = set()
+
+        self.acquired = 0
+        self.throttled = 0
+        self.backoffs = 0
+        self.total_wait = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(
+            self._burst, self._requests + elapsed * self.requests_per_second * self._scale
+        )
+        self._tokens = min(
+            self.tokens_per_minute,
+            self._tokens + elapsed * self.tokens_per_minute / 60 * self._scale,
+        )
+
+    def _delay(self, tokens: int, now: float) -> float:
+        """Seconds until a call needing `tokens` fits in both buckets (0 = go now)."""
+        self._refill(now)
+        waits = [self._blocked_until - now, 0.0]
+        if self._requests < 1:
+            waits.append(
+                (1 - self._requests) / (self.requests_per_second * self._scale)
+            )
+        if self._tokens < tokens:
+            waits.append(
+                (tokens - self._tokens) / (self.tokens_per_minute / 60 * self._scale)
+            )
+        return max(waits)
+
+    def _take_ticket(self) -> int:
+        ticket = self._next_ticket
+        self._next_ticket += 1
+        return ticket
+
+    def _advance(self) -> None:
+        """Move to the next live ticket; callers hold the condition."""
+        self._now_serving += 1
+        while self._now_serving in self._abandoned:
+            self._abandoned.discard(self._now_serving)
+            self._now_serving += 1
+        self._cond.notify_all()
+
+    def _grant(self, tokens: int, start: float) -> float:
+        self._requests -= 1
+        self._tokens -= tokens
+        self._advance()
+
+        waited = time.monotonic() - start
+        self.acquired += 1
+        self.total_wait += waited
+        if waited > 0.001:
+            self.throttled += 1
+        return waited
+
+    def acquire(self, tokens: int = 0) -> float:
+        """Block until the call may proceed; returns the seconds spent waiting."""
+        tokens = min(tokens, self.tokens_per_minute)
+        start = time.monotonic()
+        with self._cond:
+            ticket = self._take_ticket()
+            while True:
+                delay = None
+                if ticket == self._now_serving:
+                    delay = self._delay(tokens, time.monotonic())
+                    if delay <= 0:
+                        break
+                self._cond.wait(delay)
+            return self._grant(tokens, start)
+
+    async def aacquire(self, tokens: int = 0) -> float:
+        """acquire() for coroutines: waits with asyncio.sleep instead of blocking a thread."""
+        tokens = min(tokens, self.tokens_per_minute)
+        start = time.monotonic()
+        with self._cond:
+            ticket = self._take_ticket()
+        try:
+            while True:
+                with self._cond:
+                    delay = ASYNC_POLL_SECONDS
+                    if ticket == self._now_serving:
+                        delay = self._delay(tokens, time.monotonic())
+                        if delay <= 0:
+                            return self._grant(tokens, start)
+                await asyncio.sleep(min(delay, 1.0))
+        except BaseException:
+            # A cancelled waiter must not hold up everyone queued behind it
+            with self._cond:
+                if ticket == self._now_serving:
+                    self._advance()
+                elif ticket > self._now_serving:
+                    self._abandoned.add(ticket)
+            raise
+
+    def record_usage(self, estimated: int, actual: int) -> None:
+        """Correct the token bucket once the real prompt + completion size is known."""
+        with self._cond:
+            self._tokens -= actual - estimated
+
+    def backoff(self, retry_after: Optional[float] = None) -> None:
+        """Slow down after a 429: halve the rate and pause everyone briefly."""
+        with self._cond:
+            self._scale = max(MIN_SCALE, self._scale / 2)
+            pause = retry_after or 1 / (self.requests_per_second * self._scale)
+            self._blocked_until = max(self._blocked_until, time.monotonic() + pause)
+            self.backoffs += 1
+            self._cond.notify_all()
+
+    def success(self) -> None:
+        with self._cond:
+            self._scale = min(1.0, self._scale + 0.1)
+
+    def stats(self) -> Dict[str, float]:
+        with self._cond:
+            return {
+                "acquired": self.acquired,
+                "throttled": self.throttled,
+                "backoffs": self.backoffs,
+                "total_wait_seconds": round(self.total_wait, 3),
+                "rate_scale": self._scale,
+            }
+
+
+# Shared by every agent in the process so the limits apply to the API key as a whole
+mistral_rate_limiter = RateLimiter(
+    requests_per_second=float(os.getenv("MISTRAL_REQUESTS_PER_SECOND", "1")),
+    tokens_per_minute=float(os.getenv("MISTRAL_TOKENS_PER_MINUTE", "500000")),
+)
@@ -0,0 +1,134 @@
+import os
+import threading
+import time
+from typing import Any, Callable, Dict
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class Registry:
+    """
+    Process-wide home for expensive shared components.
+
+    Each component is built lazily by its factory the first time it is asked for,
+    exactly once even when many threads ask at the same time (one lock per
+    component, so unrelated components build in parallel and a factory may pull
+    in its own dependencies). Build times are recorded for reporting.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._components: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.RLock] = {}
+        self._building = threading.local()
+        self.build_seconds: Dict[str, float] = {}
+
+    def register(self, name: str, factory: Callable[[], Any]) -> None:
+        self._factories[name] = factory
+        self._locks[name] = threading.RLock()
+
+    def get(self, name: str) -> Any:
+        component = self._components.get(name)
+        if component is not None:
+            return component
+
+        with self._locks[name]:
+            component = self._components.get(name)
+            if component is not None:
+                return component
+
+            building = getattr(self._building, "names", set())
+            if name in building:
+                raise RuntimeError(f"Circular dependency while building {name!r}")
+            self._building.names = building | {name}
+            try:
+                start = time.perf_counter()
+                component = self._factories[name]()
+                self.build_seconds[name] = time.perf_counter() - start
+            finally:
+                self._building.names = building
+            self._components[name] = component
+            return component
+
+    def is_built(self, name: str) -> bool:
+        return name in self._components
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            name: {
+                "built": name in self._components,
+                "build_seconds": round(self.build_seconds[name], 4)
+                if name in self.build_seconds
+                else None,
+            }
+            for name in self._factories
+        }
+
+
+# Factories import lazily so the registry can be imported from anywhere without
+# cycles, and nothing heavy is loaded until a component is actually needed.
+
+
+def _chat_model():
+    from langchain_mistralai import ChatMistralAI
+
+    return ChatMistralAI(
+        model="mistral-large-latest",
+        temperature=0,
+        api_key=os.getenv("MISTRAl_API_KEY"),
+    )
+
+
+def _tools():
+    from tools.utility import tools
+
+    return tools()
+
+
+def _bound_model():
+    return registry.get("chat_model").bind_tools(registry.get("tools").toolkit())
+
+
+def _embeddings():
+    # "local" swaps in an offline stand-in for the Ollama embedding model
+    if os.getenv("EMBEDDINGS", "ollama") == "local":
+        from utils.semantic_cache import HashingEmbeddings
+
+        return HashingEmbeddings()
+    from langchain_ollama import OllamaEmbeddings
+
+    return OllamaEmbeddings(model="nomic-embed-text")
+
+
+def _checkpointer():
+    from utils.checkpointer import SQLiteCheckpointer
+
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return SQLiteCheckpointer(
+        os.getenv("CHECKPOINT_DB", os.path.join(backend_dir, "Data", "checkpoints.sqlite")),
+        ttl=float(os.getenv("CHECKPOINT_TTL", "86400")),
+        max_bytes=int(os.getenv("CHECKPOINT_MAX_BYTES", str(256 * 1024 * 1024))),
+        keep_checkpoints=int(os.getenv("CHECKPOINT_KEEP", "2")),
+    )
+
+
+def _workflow():
+    from Workflow.workflow import workflow
+
+    return workflow()
+
+
+def _graph():
+    return registry.get("workflow").get_graph()
+
+
+registry = Registry()
+registry.register("chat_model", _chat_model)
+registry.register("tools", _tools)
+registry.register("bound_model", _bound_model)
+registry.register("embeddings", _embeddings)
+registry.register("checkpointer", _checkpointer)
+registry.register("workflow", _workflow)
+registry.register("graph", _graph)
@@ -0,0 +1,123 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+def canonical_request(message: str) -> str:
+    """
+    Normalize an /ask message so equivalent requests share a cache entry.
+
+    JSON messages are re-serialized with sorted keys and no whitespace; anything
+    else has its whitespace collapsed.
+    """
+    try:
+        return json.dumps(json.loads(message), sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return " ".join(str(message).split())
+
+
+def is_cacheable(message: str, first_turn: bool = False) -> bool:
+    """
+    A JSON request object is answered the same way in any conversation, and so
+    is the opening message of a session. Later free-text turns ("yes", "make it
+    cheaper") depend on the session's history.
+    """
+    try:
+        request = json.loads(message)
+    except (TypeError, ValueError):
+        request = None
+    if isinstance(request, dict) and request:
+        return True
+    return first_turn and bool(str(message).strip())
+
+
+class ResponseCache:
+    """
+    Bounded LRU + TTL cache of final agent responses.
+
+    Entries are keyed on the canonical request plus the inventory version they
+    were computed against. A lookup with a new inventory version drops every
+    entry, so a data change can never serve a stale recommendation. Only lookups
+    move the cache to a new version: a response stored under any other version
+    (computed while the inventory was swapped) is discarded.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._version: Optional[Hashable] = None
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.stale_puts = 0
+
+    @staticmethod
+    def key(message: str, version: Hashable) -> str:
+        raw = repr((canonical_request(message), version))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _check_version(self, version: Hashable) -> None:
+        if version != self._version:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._version = version
+
+    def get(self, message: str, version: Hashable) -> Optional[Any]:
+        key = self.key(message, version)
+        with self._lock:
+            self._check_version(version)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, message: str, version: Hashable, response: Any) -> None:
+        key = self.key(message, version)
+        with self._lock:
+            if self._version is None:
+                self._version = version
+            elif version != self._version:
+                self.stale_puts += 1
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "stale_puts": self.stale_puts,
+            }
@@ -0,0 +1,222 @@
+import hashlib
+import json
+import re
+import threading
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+_NUMBER = re.compile(r"-?\d+(?:\.\d+)?")
+_WORD = re.compile(r"[a-z0-9_]+")
+
+# Request fields holding prose; only these are compared by embedding similarity
+FREE_TEXT_FIELDS = ("message", "question", "query", "prompt", "notes", "comment", "preferences")
+
+
+def numeric_signature(text: str) -> Tuple[float, ...]:
+    """All numbers in the text, in order; near-duplicates must match exactly."""
+    return tuple(float(n) for n in _NUMBER.findall(text))
+
+
+def split_request(message: str) -> Tuple[str, str]:
+    """
+    (structured key, free text) for a request.
+
+    For a JSON request object the key is the canonical JSON of every field
+    except the free-text ones, so budget, hashrate, runtime, location, ... must
+    all match exactly; the free text is what remains to be compared by meaning.
+    Any other message (the chat client sends plain text) is all free text.
+    """
+    try:
+        request = json.loads(message)
+    except (TypeError, ValueError):
+        request = None
+    if not isinstance(request, dict) or not request:
+        return "", " ".join(str(message).split())
+    structured = {k: v for k, v in request.items() if k not in FREE_TEXT_FIELDS}
+    text = " ".join(
+        " ".join(str(request[k]).split()) for k in FREE_TEXT_FIELDS if request.get(k) is not None
+    )
+    return json.dumps(structured, sort_keys=True, separators=(",", ":")), text
+
+
+class HashingEmbeddings(Embeddings):
+    """
+    Deterministic, offline stand-in for the Ollama embedding model.
+
+    Words and character trigrams are hashed into a fixed number of signed buckets
+    and L2-normalized, so similar wording gives similar vectors without a server.
+    """
+
+    def __init__(self, dimensions: int = 256):
+        self.dimensions = dimensions
+
+    def _features(self, text: str) -> List[str]:
+        words = _WORD.findall(text.lower())
+        joined = " ".join(words)
+        return words + [joined[i : i + 3] for i in range(max(0, len(joined) - 2))]
+
+    def embed_query(self, text: str) -> List[float]:
+        vector = np.zeros(self.dimensions)
+        for feature in self._features(text):
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], "little") % self.dimensions
+            vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+        norm = np.linalg.norm(vector)
+        return (vector / norm if norm else vector).tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self.embed_query(text) for text in texts]
+
+
+class SemanticCache:
+    """
+    In-process index of past /ask requests and their final responses.
+
+    Callers decide which messages are self-contained enough to cache (JSON
+    request objects, and the plain-text opening message of a session). A lookup
+    first requires an entry whose structured fields (everything but the
+    free-text fields; none for plain text) are identical and that was answered
+    against the current inventory version; among those, the free text is compared by embedding cosine similarity (one matrix product over
+    the stored unit vectors) and must reach the threshold with the same numbers.
+    Requests without free text never call the embedder. The cache stays off
+    until check() has seen the embedder answer, so a missing embedding server
+    costs nothing per request. The index is a fixed-size ring, so memory stays
+    bounded.
+    """
+
+    def __init__(self, embeddings: Embeddings, threshold: float = 0.9, maxsize: int = 512):
+        self.embeddings = embeddings
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.enabled = False
+        self._vectors: Optional[np.ndarray] = None
+        self._keys: List[Optional[str]] = [None] * maxsize
+        self._signatures: List[Optional[Tuple[float, ...]]] = [None] * maxsize
+        self._responses: List[Any] = [None] * maxsize
+        self._size = 0
+        self._next = 0
+        self._version: Optional[Hashable] = None
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.stale_puts = 0
+        self.lookup_seconds = 0.0
+
+    def check(self) -> bool:
+        """Health-check the embedder; the cache serves only after this succeeds."""
+        try:
+            self._embed("health check")
+            self.enabled = True
+        except Exception as e:
+            print(f"Semantic cache disabled, embeddings unavailable: {e}")
+            self.enabled = False
+        return self.enabled
+
+    def _embed(self, text: str) -> np.ndarray:
+        vector = np.asarray(self.embeddings.embed_query(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _check_version(self, version: Hashable) -> None:
+        if version != self._version:
+            self._size = 0
+            self._next = 0
+            self._version = version
+
+    def get(self, message: str, version: Hashable) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        key, text = split_request(message)
+        start = time.perf_counter()
+        query = None
+        if text:
+            try:
+                query = self._embed(text)
+            except Exception as e:
+                # The embedding service failing should only cost a cache miss
+                print(f"Semantic cache embedding failed: {e}")
+                with self._lock:
+                    self.errors += 1
+                    self.misses += 1
+                return None
+        signature = numeric_signature(text)
+
+        with self._lock:
+            self._check_version(version)
+            response = None
+            same = [i for i in range(self._size) if self._keys[i] == key]
+            if same and query is None:
+                # No free text: identical structured fields are the whole request
+                response = next(
+                    (self._responses[i] for i in same if self._signatures[i] is None), None
+                )
+            elif same and self._vectors is not None and self._vectors.shape[1] == len(query):
+                candidates = [i for i in same if self._signatures[i] == signature]
+                if candidates:
+                    scores = self._vectors[candidates] @ query
+                    best = int(np.argmax(scores))
+                    if scores[best] >= self.threshold:
+                        response = self._responses[candidates[best]]
+            if response is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            self.lookup_seconds += time.perf_counter() - start
+        return response
+
+    def put(self, message: str, version: Hashable, response: Any) -> None:
+        if not self.enabled:
+            return
+        key, text = split_request(message)
+        vector = None
+        if text:
+            try:
+                vector = self._embed(text)
+            except Exception:
+                return
+        with self._lock:
+            # Only lookups move to a new version; a response computed against an
+            # inventory that has since been swapped is dropped
+            if self._version is None:
+                self._version = version
+            elif version != self._version:
+                self.stale_puts += 1
+                return
+            if vector is not None and self._vectors is None:
+                self._vectors = np.zeros((self.maxsize, len(vector)), dtype=np.float32)
+            elif vector is not None and self._vectors.shape[1] != len(vector):
+                # A different embedding model: stored vectors are no longer comparable
+                self._vectors = np.zeros((self.maxsize, len(vector)), dtype=np.float32)
+                self._size = self._next = 0
+            i = self._next
+            if vector is not None:
+                self._vectors[i] = vector
+            self._keys[i] = key
+            # None marks an entry without free text
+            self._signatures[i] = numeric_signature(text) if text else None
+            self._responses[i] = response
+            self._next = (i + 1) % self.maxsize
+            self._size = min(self._size + 1, self.maxsize)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size": self._size,
+                "maxsize": self.maxsize,
+                "threshold": self.threshold,
+                "hits": self.hits,
+                "misses": self.misses,
+                "errors": self.errors,
+                "stale_puts": self.stale_puts,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "avg_lookup_ms": round(self.lookup_seconds / lookups * 1000, 3)
+                if lookups
+                else 0.0,
+            }
@@ -0,0 +1,77 @@
+import json
+from typing import Any, AsyncIterator, Dict, Iterator, List, Tuple
+
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+# Progress labels shown to the client for each tool the agent calls
+TOOL_LABELS = {
+    "retrieve": "fetching inventory",
+    "rank_asics": "ranking",
+    "fulfill_hashrate": "optimizing allocation",
+    "summarize_models": "summarizing models",
+}
+
+# Graph stream modes the translators below expect
+STREAM_MODES = ["updates", "messages"]
+
+Event = Tuple[str, Dict[str, Any]]
+
+
+def sse(event: str, data: Dict[str, Any]) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+class _Translator:
+    """Turns (mode, payload) items from graph.stream into client events."""
+
+    def __init__(self):
+        self.final = None
+
+    def __call__(self, mode: str, payload: Any) -> List[Event]:
+        if mode == "messages":
+            chunk, metadata = payload
+            if (
+                metadata.get("langgraph_node") == "agent"
+                and isinstance(chunk, AIMessageChunk)
+                and isinstance(chunk.content, str)
+                and chunk.content
+            ):
+                return [("token", {"content": chunk.content})]
+            return []
+
+        events = []
+        for node, update in (payload or {}).items():
+            messages = (update or {}).get("messages", [])
+            if node == "agent":
+                for message in messages:
+                    if not isinstance(message, AIMessage):
+                        continue
+                    if message.tool_calls:
+                        for call in message.tool_calls:
+                            label = TOOL_LABELS.get(call["name"], f"running {call['name']}")
+                            events.append(("progress", {"node": "tools_execution", "status": label}))
+                    else:
+                        self.final = message.content
+            elif node == "tools_execution":
+                events.append(("progress", {"node": "agent", "status": "writing recommendation"}))
+        return events
+
+
+def stream_events(stream: Iterator[Tuple[str, Any]]) -> Iterator[Event]:
+    """Client events for a graph.stream(..., stream_mode=STREAM_MODES) iterator."""
+    translate = _Translator()
+    yield ("progress", {"node": "agent", "status": "thinking"})
+    for mode, payload in stream:
+        yield from translate(mode, payload)
+    yield ("done", {"response": translate.final or "No response generated."})
+
+
+async def astream_events(stream: AsyncIterator[Tuple[str, Any]]) -> AsyncIterator[Event]:
+    """Async twin of stream_events for graph.astream."""
+    translate = _Translator()
+    yield ("progress", {"node": "agent", "status": "thinking"})
+    async for mode, payload in stream:
+        for event in translate(mode, payload):
+            yield event
+    yield ("done", {"response": translate.final or "No response generated."})